@@ -0,0 +1,6 @@
+"""
+Benchmarks for the schema tester hot paths. Run with `python -m benchmarks`.
+"""
+import os
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "test_project.settings")
@@ -0,0 +1,114 @@
+"""
+Runs the benchmark suite, and optionally compares the results to a stored baseline.
+
+    python -m benchmarks                              # run and print the results
+    python -m benchmarks --baseline                   # fail if anything regressed compared to benchmarks/baseline.json
+    python -m benchmarks --save-baseline              # overwrite benchmarks/baseline.json
+    python -m benchmarks --full                       # include the largest schemas and payloads
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+import django
+
+django.setup()
+
+from benchmarks.suites import Operation, get_benchmarks  # noqa: E402
+
+BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def percentile(timings: List[float], fraction: float) -> float:
+    ordered = sorted(timings)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def run(setup: Callable[[], Operation], repetitions: int) -> Dict[str, float]:
+    """
+    Times an operation, and measures its peak memory in a separate run, since tracing slows everything down.
+    """
+    operation = setup()
+    operation()  # warm up
+    timings = []
+    gc.collect()
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        operation()
+        timings.append(time.perf_counter() - start)
+    tracemalloc.start()
+    operation()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "ops_per_second": len(timings) / sum(timings),
+        "p50_ms": percentile(timings, 0.5) * 1000,
+        "p99_ms": percentile(timings, 0.99) * 1000,
+        "peak_memory_kb": peak / 1024,
+    }
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]], tolerance: float) -> List[str]:
+    """
+    Returns a description of every benchmark that is slower, or uses more memory, than the baseline allows.
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        expected = baseline[name]
+        if result["p50_ms"] > expected["p50_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p50 {result['p50_ms']:.3f}ms, baseline {expected['p50_ms']:.3f}ms")
+        if result["peak_memory_kb"] > expected["peak_memory_kb"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: peak memory {result['peak_memory_kb']:.0f}KiB, baseline {expected['peak_memory_kb']:.0f}KiB"
+            )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmarks drf-openapi-tester.")
+    parser.add_argument("--full", action="store_true", help="include the largest schemas and payloads")
+    parser.add_argument("-k", dest="keyword", default="", help="only run benchmarks with this substring in their name")
+    parser.add_argument("--json", dest="json_path", help="write the results to this file")
+    parser.add_argument(
+        "--baseline", nargs="?", const=BASELINE, help="compare the results to a baseline file, and fail on regressions"
+    )
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown before failing (default 0.25)")
+    parser.add_argument("--save-baseline", action="store_true", help=f"write the results to {BASELINE}")
+    args = parser.parse_args()
+
+    results: Dict[str, Dict[str, float]] = {}
+    print(f"{'benchmark':<60} {'ops/s':>12} {'p50 ms':>10} {'p99 ms':>10} {'peak KiB':>10}")
+    for name, (setup, repetitions) in get_benchmarks(full=args.full).items():
+        if args.keyword not in name:
+            continue
+        result = results[name] = run(setup, repetitions)
+        print(
+            f"{name:<60} {result['ops_per_second']:>12.1f} {result['p50_ms']:>10.3f} "
+            f"{result['p99_ms']:>10.3f} {result['peak_memory_kb']:>10.0f}"
+        )
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    if args.save_baseline:
+        with open(BASELINE, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write("\n")
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print("\nRegressions:\n" + "\n".join(regressions))
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""
+Generators for synthetic OpenAPI schemas and matching payloads.
+"""
+from typing import Any, Dict, List
+
+from rest_framework.response import Response
+
+# a real route in the test project, so benchmarks exercise the same path resolution as regular tests
+ITEMS_PATH = "/api/{version}/items"
+ITEMS_URL = "/api/v1/items"
+
+FIELD_TYPES = [
+    {"type": "string"},
+    {"type": "integer"},
+    {"type": "number", "format": "double"},
+    {"type": "boolean"},
+    {"type": "integer", "format": "int64"},
+    {"type": "string", "enum": ["a", "b", "c"]},
+    {"type": "string", "pattern": "^[a-z]+$"},
+]
+FIELD_VALUES = ["value", 1, 1.5, True, 2 ** 40, "b", "abc"]
+VERSION_PARAMETER = {"name": "version", "in": "path", "required": True, "schema": {"type": "string"}}
+
+
+def object_schema(width: int) -> dict:
+    """
+    Returns an object schema with `width` properties of mixed types.
+    """
+    return {
+        "type": "object",
+        "properties": {f"field{i}": FIELD_TYPES[i % len(FIELD_TYPES)] for i in range(width)},
+    }
+
+
+def object_payload(width: int) -> dict:
+    return {f"field{i}": FIELD_VALUES[i % len(FIELD_VALUES)] for i in range(width)}
+
+
+def list_schema(width: int) -> dict:
+    return {"type": "array", "items": object_schema(width)}
+
+
+def list_payload(length: int, width: int) -> List[dict]:
+    return [object_payload(width) for _ in range(length)]
+
+
+def operation(schema: dict) -> dict:
+    return {
+        "get": {
+            "responses": {
+                "200": {"description": "", "content": {"application/json": {"schema": schema}}},
+            }
+        }
+    }
+
+
+def synthetic_spec(path_count: int, width: int = 10) -> dict:
+    """
+    Returns an OpenAPI 3 schema with `path_count` paths, all sharing a `$ref`'d component.
+
+    The items route of the test project is always included, so responses can be validated against the schema.
+    """
+    paths: Dict[str, Any] = {ITEMS_PATH: {"parameters": [VERSION_PARAMETER], **operation(list_schema(width))}}
+    for i in range(path_count - 1):
+        paths[f"/api/{{version}}/resource{i}/{{id}}"] = {
+            "parameters": [
+                VERSION_PARAMETER,
+                {"name": "id", "in": "path", "required": True, "schema": {"type": "integer"}},
+            ],
+            **operation({"$ref": "#/components/schemas/Resource"}),
+        }
+    return {
+        "openapi": "3.0.0",
+        "info": {"title": "Synthetic schema", "version": "1.0.0"},
+        "paths": paths,
+        "components": {"schemas": {"Resource": object_schema(width)}},
+    }
+
+
+def response(data: Any, url: str = ITEMS_URL, method: str = "GET", status_code: int = 200) -> Response:
+    """
+    Returns a DRF response, shaped like the ones returned by the test client.
+    """
+    drf_response = Response(status=status_code, data=data)
+    drf_response.request = {"REQUEST_METHOD": method, "PATH_INFO": url}  # type: ignore
+    drf_response.json = lambda: data  # type: ignore
+    return drf_response
@@ -0,0 +1,131 @@
+"""
+Benchmark definitions.
+
+Each benchmark is a setup function that prepares its inputs and returns the operation to time. Setup is never timed.
+"""
+import glob
+import os
+from copy import deepcopy
+from typing import Callable, Dict, List, Tuple
+
+from benchmarks import generators
+from openapi_tester import SchemaTester, StaticSchemaLoader
+from openapi_tester.schema_converter import SchemaToPythonConverter
+
+SAMPLE_SCHEMAS = os.path.join(os.path.dirname(os.path.dirname(__file__)), "tests", "schemas", "sample-schemas")
+
+Operation = Callable[[], None]
+# name -> (setup function, number of timed repetitions)
+Benchmarks = Dict[str, Tuple[Callable[[], Operation], int]]
+
+
+def _static_tester(schema: dict) -> SchemaTester:
+    tester = SchemaTester(schema_file_path="")
+    tester.loader.set_schema(schema)
+    return tester
+
+
+def validate_response(length: int, width: int) -> Callable[[], Operation]:
+    def setup() -> Operation:
+        tester = _static_tester(generators.synthetic_spec(path_count=1, width=width))
+        response = generators.response(generators.list_payload(length, width))
+        return lambda: tester.validate_response(response)
+
+    return setup
+
+
+def set_schema(schema: dict) -> Callable[[], Operation]:
+    def setup() -> Operation:
+        loader = StaticSchemaLoader("")
+        return lambda: loader.set_schema(deepcopy(schema))
+
+    return setup
+
+
+def load_schema(file_name: str) -> Callable[[], Operation]:
+    """
+    Reads and parses a schema file.
+    """
+
+    def setup() -> Operation:
+        loader = StaticSchemaLoader(file_name)
+        return lambda: loader.load_schema()
+
+    return setup
+
+
+def process_schema(schema: dict) -> Callable[[], Operation]:
+    """
+    De-references and validates a schema, without resolving its paths against the test project's URLconf.
+    """
+
+    def setup() -> Operation:
+        loader = StaticSchemaLoader("")
+        return lambda: loader.validate_schema(loader.de_reference_schema(deepcopy(schema)))
+
+    return setup
+
+
+def parameterize_path(cached: bool) -> Callable[[], Operation]:
+    def setup() -> Operation:
+        loader = StaticSchemaLoader("")
+
+        def operation() -> None:
+            if not cached:
+                loader.clear_route_cache()
+            loader.parameterize_path(generators.ITEMS_URL)
+
+        return operation
+
+    return setup
+
+
+def convert_schema(width: int, with_faker: bool) -> Callable[[], Operation]:
+    def setup() -> Operation:
+        schema = generators.list_schema(width)
+        return lambda: SchemaToPythonConverter(schema, with_faker=with_faker)
+
+    return setup
+
+
+def sample_schemas() -> List[Tuple[str, dict]]:
+    """
+    Returns the sample schemas that can be loaded without network access.
+    """
+    schemas = []
+    for file_name in sorted(glob.iglob(f"{SAMPLE_SCHEMAS}/**", recursive=True)):
+        if not os.path.isfile(file_name):
+            continue
+        loader = StaticSchemaLoader(file_name)
+        try:
+            schema = loader.load_schema()
+            loader.validate_schema(loader.de_reference_schema(deepcopy(schema)))
+        except Exception:  # noqa: B902
+            continue
+        schemas.append((os.path.relpath(file_name, SAMPLE_SCHEMAS), schema))
+    return schemas
+
+
+def get_benchmarks(full: bool = False) -> Benchmarks:
+    """
+    Returns all benchmarks. The full suite adds the largest schemas and payloads, which take minutes to run.
+    """
+    lengths = [100, 10_000, 100_000] if full else [100, 10_000]
+    path_counts = [100, 1_000, 10_000] if full else [100, 1_000]
+    benchmarks: Benchmarks = {}
+    for length in lengths:
+        benchmarks[f"validate_response[items={length},width=10]"] = (validate_response(length, 10), 20)
+    benchmarks["validate_response[items=1000,width=200]"] = (validate_response(1_000, 200), 20)
+    for name, schema in sample_schemas():
+        benchmarks[f"load_schema[{name}]"] = (load_schema(os.path.join(SAMPLE_SCHEMAS, name)), 5)
+        benchmarks[f"process_schema[{name}]"] = (process_schema(schema), 5)
+    for path_count in path_counts:
+        benchmarks[f"set_schema[synthetic,paths={path_count}]"] = (
+            set_schema(generators.synthetic_spec(path_count)),
+            3,
+        )
+    benchmarks["parameterize_path[cached]"] = (parameterize_path(cached=True), 10_000)
+    benchmarks["parameterize_path[uncached]"] = (parameterize_path(cached=False), 1_000)
+    benchmarks["SchemaToPythonConverter[width=50]"] = (convert_schema(50, with_faker=False), 1_000)
+    benchmarks["SchemaToPythonConverter[width=50,faker]"] = (convert_schema(50, with_faker=True), 100)
+    return benchmarks
@@ -0,0 +1 @@
+pytest_plugins = ["openapi_tester.pytest_plugin", "pytester"]
@@ -1,7 +1,15 @@
 # flake8: noqa
-from .case_testers import is_camel_case, is_kebab_case, is_pascal_case, is_snake_case
+from .case_testers import create_case_tester, is_camel_case, is_kebab_case, is_pascal_case, is_snake_case
 from .constants import OPENAPI_PYTHON_MAPPING
-from .exceptions import CaseError, DocumentationError, OpenAPISchemaError, UndocumentedSchemaSectionError
+from .exceptions import (
+    CaseError,
+    DocumentationError,
+    DocumentationErrors,
+    OpenAPISchemaError,
+    UndocumentedSchemaSectionError,
+)
 from .loaders import BaseSchemaLoader, DrfSpectacularSchemaLoader, DrfYasgSchemaLoader, StaticSchemaLoader
 from .schema_converter import SchemaToPythonConverter
 from .schema_tester import SchemaTester
+
+__version__ = "0.1.0"
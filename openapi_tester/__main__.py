@@ -0,0 +1,84 @@
+"""
+Command line tools. Django must be configured, through the DJANGO_SETTINGS_MODULE environment variable.
+
+    python -m openapi_tester validate-traffic capture.har dump.jsonl    # validate recorded responses
+"""
+import argparse
+import json
+import sys
+from typing import Any, Dict, List, Optional
+
+import django
+
+from openapi_tester.coverage import Operation
+from openapi_tester.traffic import validate_traffic
+
+
+def print_results(results: Dict[Operation, List[Any]]) -> None:
+    print(f"{'operation':<70} {'validated':>10} {'failed':>10}")
+    for (path, method, status_code), (validated, failed, _) in sorted(results.items()):
+        print(f"{f'{method.upper()} {path} {status_code}'.strip():<70} {validated:>10} {failed:>10}")
+    failures = [(operation, message) for operation, (_, failed, message) in sorted(results.items()) if failed]
+    for (path, method, status_code), message in failures:
+        heading = f"{method.upper()} {path} {status_code}".strip()
+        print(f"\n{heading}\n\n{message}")
+    total = sum(validated for validated, _, _ in results.values())
+    failed = sum(failed for _, failed, _ in results.values())
+    print(f"\n{total} responses validated, {failed} failed")
+
+
+def validate_traffic_command(args: argparse.Namespace) -> int:
+    results = validate_traffic(
+        args.files,
+        workers=args.workers,
+        batch_size=args.batch_size,
+        schema_file_path=args.schema_file_path,
+        case_tester=args.case_tester,
+        ignore_case=args.ignore_case,
+    )
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(
+                [
+                    {
+                        "path": path,
+                        "method": method,
+                        "status_code": status_code,
+                        "validated": validated,
+                        "failed": failed,
+                        "message": message,
+                    }
+                    for (path, method, status_code), (validated, failed, message) in sorted(results.items())
+                ],
+                f,
+                indent=2,
+            )
+    print_results(results)
+    return 1 if any(failed for _, failed, _ in results.values()) else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m openapi_tester", description="drf-openapi-tester tools.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    traffic = commands.add_parser(
+        "validate-traffic",
+        help="validate recorded responses against the OpenAPI schema",
+        description="Validates the JSON responses in HAR files, and JSON-lines files with an object per line with a "
+        "method, path or url, status_code, and body, against the OpenAPI schema.",
+    )
+    traffic.add_argument("files", nargs="+", help="HAR (.har) or JSON-lines files")
+    traffic.add_argument("--schema-file-path", help="a static schema file, instead of the schema of the Django project")
+    traffic.add_argument("--case-tester", help="camel_case, kebab_case, pascal_case, snake_case, or an import path")
+    traffic.add_argument("--ignore-case", nargs="*", help="keys to ignore when testing the case of response keys")
+    traffic.add_argument("--workers", type=int, help="number of worker processes (default: the number of CPUs)")
+    traffic.add_argument("--batch-size", type=int, default=100, help="responses sent to a worker at a time")
+    traffic.add_argument("--json", dest="json_path", help="also write the results to this file")
+    traffic.set_defaults(handler=validate_traffic_command)
+    args = parser.parse_args(argv)
+
+    django.setup()
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
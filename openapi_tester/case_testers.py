@@ -1,18 +1,42 @@
-from typing import Any, Callable
+from functools import lru_cache
+from typing import Callable, Optional
 
 from inflection import camelize, dasherize, underscore
 
 from openapi_tester.exceptions import CaseError
 
+# the number of keys each case tester remembers the verdict for
+CACHE_SIZE = 4096
 
-def _create_tester(casing: str, handler: Callable[[Any], str]) -> Callable[[str], None]:
-    """ factory function for creating testers """
 
-    def tester(key: str) -> None:
+def create_case_tester(
+    casing: str, handler: Callable[[str], str], cache_size: Optional[int] = CACHE_SIZE
+) -> Callable[[str], None]:
+    """
+    Creates a case tester, which raises a CaseError for keys that the handler doesn't leave unchanged.
+
+    Verdicts are cached per key, since the same keys are tested over and over. The cache is exposed as the tester's
+    `cache_info` and `cache_clear` attributes.
+
+    :param casing: The name of the casing, used in error messages, e.g., "camelCased"
+    :param handler: Converts a key to the expected casing
+    :param cache_size: The number of keys to remember the verdict for, or None for no limit
+    """
+
+    @lru_cache(maxsize=cache_size)
+    def get_expected(key: str) -> Optional[str]:
         stripped = key.strip()
         if len(stripped) and not handler(stripped) == stripped:
-            raise CaseError(key=key, case=casing, expected=handler(key))
+            return handler(key)
+        return None
+
+    def tester(key: str) -> None:
+        expected = get_expected(key)
+        if expected is not None:
+            raise CaseError(key=key, case=casing, expected=expected)
 
+    tester.cache_info = get_expected.cache_info  # type: ignore
+    tester.cache_clear = get_expected.cache_clear  # type: ignore
     return tester
 
 
@@ -28,7 +52,7 @@ def _kebabize(s: str) -> str:
     return dasherize(underscore(s))
 
 
-is_camel_case = _create_tester("camelCased", _camelize)
-is_kebab_case = _create_tester("kebab-cased", _kebabize)
-is_pascal_case = _create_tester("PascalCased", _pascalize)
-is_snake_case = _create_tester("snake_cased", underscore)
+is_camel_case = create_case_tester("camelCased", _camelize)
+is_kebab_case = create_case_tester("kebab-cased", _kebabize)
+is_pascal_case = create_case_tester("PascalCased", _pascalize)
+is_snake_case = create_case_tester("snake_cased", underscore)
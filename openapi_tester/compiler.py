@@ -0,0 +1,201 @@
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, Union
+
+from openapi_tester.exceptions import OpenAPISchemaError
+
+Validator = Callable[[dict, Any], Union[Optional[str], bool]]
+ReferenceResolver = Callable[[dict], dict]
+
+
+def handle_all_of(**kwargs: dict) -> dict:
+    """
+    Merges the properties of the schemas in `allOf` into a single object schema.
+    """
+    properties: Dict[str, Any] = {}
+    for entry in kwargs.pop("allOf"):
+        for key, value in entry["properties"].items():
+            if key in properties and isinstance(value, dict):
+                properties[key] = {**properties[key], **value}
+            elif key in properties and isinstance(value, list):
+                properties[key] = [*properties[key], *value]
+            else:
+                properties[key] = value
+    return {**kwargs, "type": "object", "properties": properties}
+
+
+class SchemaNode:
+    """
+    A pre-processed schema section.
+
+    Holds everything the schema tester needs to validate data against a schema section, so that the raw schema dict
+    only has to be interpreted once, and not once per response.
+    """
+
+    __slots__ = (
+        "schema",
+        "one_of",
+        "any_of",
+        "discriminator",
+        "type",
+        "validators",
+        "properties",
+        "property_keys",
+        "required_keys",
+        "additional_properties",
+        "items",
+        "miscased_keys",
+    )
+
+    def __init__(self, schema: dict) -> None:
+        self.schema = schema
+        self.one_of: Optional[List["SchemaNode"]] = None
+        self.any_of: Optional[List["SchemaNode"]] = None
+        # the discriminator property name, and the oneOf or anyOf option selected by each of its values
+        self.discriminator: Optional[Tuple[str, Dict[str, "SchemaNode"]]] = None
+        self.type: Optional[str] = None
+        self.validators: List[Validator] = []
+        self.properties: Dict[str, "SchemaNode"] = {}
+        self.property_keys: FrozenSet[str] = frozenset()
+        self.required_keys: FrozenSet[str] = frozenset()
+        # None if undeclared keys are not allowed, True if they can hold anything, else the node they're tested against
+        self.additional_properties: Union[None, bool, "SchemaNode"] = None
+        self.items: Optional["SchemaNode"] = None
+        # the declared keys that each case tester rejects, filled in the first time the node is tested with it
+        self.miscased_keys: Dict[Callable[[str], None], FrozenSet[str]] = {}
+
+
+class SchemaCompiler:
+    """
+    Compiles schema sections into trees of schema nodes.
+
+    Nodes are memoized on the identity of the schema dict they were built from, so sections that are shared between
+    operations are only compiled once per compiler.
+
+    If a reference resolver is passed, `$ref`s are followed as they are compiled. Every reference to a component
+    resolves to the same node, so recursive schemas compile to a cyclic graph, and can be validated to any depth.
+
+    The reference lookup is used to find the options that discriminator mappings point to.
+    """
+
+    def __init__(
+        self,
+        get_validators: Callable[[dict], List[Validator]],
+        resolve_reference: Optional[ReferenceResolver] = None,
+        lookup_reference: Optional[ReferenceResolver] = None,
+    ) -> None:
+        self.get_validators = get_validators
+        self.resolve_reference = resolve_reference
+        self.lookup_reference = lookup_reference
+        # the source dict is stored alongside its node, to keep its id from being reused while the node is memoized
+        self.nodes: Dict[int, Tuple[Any, SchemaNode]] = {}
+
+    def compile(self, schema_section: dict) -> SchemaNode:
+        """
+        Returns the compiled node for a schema section.
+        """
+        if self.resolve_reference is not None and isinstance(schema_section, dict) and "$ref" in schema_section:
+            schema_section = self.resolve_reference(schema_section)
+        key = id(schema_section)
+        if key in self.nodes:
+            return self.nodes[key][1]
+        node = SchemaNode(schema_section if isinstance(schema_section, dict) else {})
+        self.nodes[key] = (schema_section, node)
+
+        schema = node.schema
+        if "oneOf" in schema:
+            node.one_of = [self.compile(option) for option in schema["oneOf"]]
+        if "anyOf" in schema:
+            node.any_of = [self.compile(option) for option in schema["anyOf"]]
+        if isinstance(schema.get("discriminator"), dict) and (node.one_of or node.any_of):
+            options = schema["oneOf"] if node.one_of else schema["anyOf"]
+            node.discriminator = self.compile_discriminator(
+                schema["discriminator"], options, node.one_of or node.any_of
+            )
+
+        if "allOf" in schema:
+            if self.resolve_reference is not None:
+                schema = {**schema, "allOf": [self.resolve_reference(entry) for entry in schema["allOf"]]}
+            schema = node.schema = handle_all_of(**schema)
+        node.type = schema.get("type")
+        if not node.type and "properties" in schema:
+            node.type = "object"
+        if not node.type:
+            # No schema type == any schema type, so there is nothing else to prepare
+            return node
+
+        node.validators = self.get_validators(schema)
+        if node.type == "object":
+            properties = schema.get("properties") or {}
+            node.properties = {key: self.compile(value) for key, value in properties.items()}
+            node.property_keys = frozenset(properties)
+            node.required_keys = frozenset(schema["required"] if "required" in schema else properties)
+            # objects without declared properties, e.g., for JSONField and DictField, are free-form, unless additional
+            # properties are explicitly disallowed
+            additional_properties = schema.get("additionalProperties", "properties" not in schema)
+            if isinstance(additional_properties, dict):
+                node.additional_properties = self.compile(additional_properties) if additional_properties else True
+            elif additional_properties:
+                node.additional_properties = True
+        elif node.type == "array" and schema.get("items") is not None:
+            node.items = self.compile(schema["items"])
+        return node
+
+    def compile_discriminator(
+        self, discriminator: dict, options: List[Any], nodes: List[SchemaNode]
+    ) -> Optional[Tuple[str, Dict[str, SchemaNode]]]:
+        """
+        Maps each discriminator value to the option it selects.
+
+        Mapped options are matched on their reference where references are preserved, and otherwise on being equal to
+        the schema section the mapping points to. Unmapped options are selected by the name of the component they
+        reference, or by the value of a single-valued enum for the discriminator property.
+
+        :return: The property name and mapping, or None if no option can be selected by discriminator
+        """
+        property_name = discriminator.get("propertyName")
+        if not property_name:
+            return None
+        references = {
+            option["$ref"]: node
+            for option, node in zip(options, nodes)
+            if isinstance(option, dict) and isinstance(option.get("$ref"), str)
+        }
+        mapping: Dict[str, SchemaNode] = {}
+        for value, reference in (discriminator.get("mapping") or {}).items():
+            if not reference.startswith("#"):
+                reference = f"#/components/schemas/{reference}"
+            if reference in references:
+                mapping[value] = references[reference]
+            elif self.lookup_reference is not None:
+                try:
+                    target = self.lookup_reference({"$ref": reference})
+                except OpenAPISchemaError:
+                    continue
+                for option, node in zip(options, nodes):
+                    if option is target or option == target:
+                        mapping[value] = node
+                        break
+        for reference, node in references.items():
+            mapping.setdefault(reference.rsplit("/", 1)[-1], node)
+        for node in nodes:
+            enum = node.properties[property_name].schema.get("enum") if property_name in node.properties else None
+            if isinstance(enum, list) and len(enum) == 1 and isinstance(enum[0], str):
+                mapping.setdefault(enum[0], node)
+        return (property_name, mapping) if mapping else None
+
+
+def expand_references(schema: Any, resolve_reference: ReferenceResolver, _seen: Tuple[str, ...] = ()) -> Any:
+    """
+    Returns a copy of a schema section with all references expanded, for use in error messages.
+
+    Recursive references are replaced with an empty schema.
+    """
+    if isinstance(schema, dict):
+        if "$ref" in schema:
+            reference = schema["$ref"]
+            if reference in _seen:
+                return {}
+            return expand_references(resolve_reference(schema), resolve_reference, (*_seen, reference))
+        return {key: expand_references(value, resolve_reference, _seen) for key, value in schema.items()}
+    if isinstance(schema, list):
+        return [expand_references(item, resolve_reference, _seen) for item in schema]
+    return schema
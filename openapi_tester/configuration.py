@@ -0,0 +1,46 @@
+"""
+Schema tester options configured in the OPENAPI_TESTER Django setting.
+"""
+from typing import Any, Callable, Dict, Optional
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from openapi_tester import case_testers
+
+CASE_TESTERS = {
+    "camel_case": case_testers.is_camel_case,
+    "kebab_case": case_testers.is_kebab_case,
+    "pascal_case": case_testers.is_pascal_case,
+    "snake_case": case_testers.is_snake_case,
+}
+
+
+def get_case_tester(case_tester: Any) -> Optional[Callable[[str], None]]:
+    """
+    Returns a case tester from its name in CASE_TESTERS, its import path, or the case tester itself.
+    """
+    if not case_tester or callable(case_tester):
+        return case_tester
+    if case_tester in CASE_TESTERS:
+        return CASE_TESTERS[case_tester]
+    return import_string(case_tester)
+
+
+def get_setting(key: str, default: Any = None) -> Any:
+    return getattr(settings, "OPENAPI_TESTER", {}).get(key, default)
+
+
+def get_settings_options() -> Dict[str, Any]:
+    """
+    Returns the schema tester arguments configured in the OPENAPI_TESTER Django setting.
+    """
+    return {
+        "schema_file_path": get_setting("SCHEMA_FILE_PATH"),
+        "case_tester": get_case_tester(get_setting("CASE_TESTER")),
+        "ignore_case": get_setting("IGNORE_CASE"),
+        "schema_cache_dir": get_setting("SCHEMA_CACHE_DIR"),
+        "preserve_references": get_setting("PRESERVE_REFERENCES", False),
+        "watch_schema": get_setting("WATCH_SCHEMA", False),
+        "schema_validation": get_setting("SCHEMA_VALIDATION", "always"),
+    }
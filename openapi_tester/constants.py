@@ -10,3 +10,5 @@ OPENAPI_PYTHON_MAPPING = {
     "number": f"{int.__name__} or {float.__name__}",
 }
 PARAMETER_CAPTURE_REGEX = re.compile(r"({[\w]+})")
+SHARED_SCHEMA_ENV_VAR = "OPENAPI_TESTER_SHARED_SCHEMA"
+SHARED_SCHEMA_HASH_ENV_VAR = "OPENAPI_TESTER_SHARED_SCHEMA_HASH"
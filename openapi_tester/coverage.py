@@ -0,0 +1,112 @@
+import json
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+from xml.etree import ElementTree
+
+HTTP_METHODS = {"get", "put", "post", "delete", "options", "head", "patch", "trace"}
+
+# (parameterized path, lowercase HTTP method, status code)
+Operation = Tuple[str, str, str]
+
+
+class EndpointCoverage:
+    """
+    Counts the responses validated for each documented path, method and status code.
+    """
+
+    def __init__(self) -> None:
+        self.counter: Counter = Counter()
+
+    def record(self, operation: Operation) -> None:
+        self.counter[operation] += 1
+
+    def clear(self) -> None:
+        self.counter.clear()
+
+    def merge(self, counts: Iterable[Tuple[Operation, int]]) -> None:
+        """
+        Adds response counts recorded elsewhere, e.g., `counter.items()` of another process.
+        """
+        for operation, count in counts:
+            self.counter[tuple(operation)] += count
+
+    @staticmethod
+    def get_documented_operations(
+        schema: dict, resolve_reference: Optional[Callable[[dict], dict]] = None
+    ) -> Set[Operation]:
+        """
+        Returns every path, method and status code documented in a schema.
+
+        Default responses are left out, since a response is only ever matched to the status code it was returned with.
+        """
+        resolve = resolve_reference or (lambda section: section)
+        operations = set()
+        for path, path_object in schema["paths"].items():
+            for method, method_object in resolve(path_object).items():
+                if method.lower() not in HTTP_METHODS:
+                    continue
+                for status_code in method_object.get("responses", {}):
+                    if str(status_code) != "default":
+                        operations.add((path, method.lower(), str(status_code)))
+        return operations
+
+    def get_report(self, schema: dict, resolve_reference: Optional[Callable[[dict], dict]] = None) -> Dict[str, Any]:
+        """
+        Returns the coverage of a schema by the responses validated so far.
+
+        :return: A JSON serializable dict listing validated responses with their counts, responses that were validated
+            but are not documented, and documented responses that were never validated
+        """
+        documented = self.get_documented_operations(schema, resolve_reference)
+
+        def as_dicts(operations: Set[Operation]) -> List[Dict[str, Any]]:
+            return [
+                {"path": path, "method": method, "status_code": status, "count": self.counter[(path, method, status)]}
+                for path, method, status in sorted(operations)
+            ]
+
+        validated = documented.intersection(self.counter)
+        return {
+            "documented": len(documented),
+            "coverage": round(len(validated) / len(documented), 4) if documented else 1.0,
+            "validated": as_dicts(validated),
+            "undocumented": as_dicts(set(self.counter) - documented),
+            "not_validated": as_dicts(documented - validated),
+        }
+
+    @staticmethod
+    def write_json(report: Dict[str, Any], file_path: str) -> None:
+        with open(file_path, "w") as f:
+            json.dump(report, f, indent=2)
+
+    @staticmethod
+    def write_junit(report: Dict[str, Any], file_path: str) -> None:
+        """
+        Writes a report as JUnit XML, with a test case per response, so it can be displayed by CI servers.
+
+        Undocumented responses are failures, and documented responses that were never validated are skipped.
+        """
+        cases = [
+            *((entry, None) for entry in report["validated"]),
+            *((entry, "failure") for entry in report["undocumented"]),
+            *((entry, "skipped") for entry in report["not_validated"]),
+        ]
+        suite = ElementTree.Element(
+            "testsuite",
+            name="openapi-coverage",
+            tests=str(len(cases)),
+            failures=str(len(report["undocumented"])),
+            skipped=str(len(report["not_validated"])),
+        )
+        for entry, outcome in cases:
+            case = ElementTree.SubElement(
+                suite,
+                "testcase",
+                classname=f"{entry['method'].upper()} {entry['path']}",
+                name=entry["status_code"],
+            )
+            if outcome == "failure":
+                ElementTree.SubElement(case, "failure", message="Response is not documented")
+            elif outcome == "skipped":
+                ElementTree.SubElement(case, "skipped", message="Response was never validated")
+        ElementTree.ElementTree(suite).write(file_path, encoding="utf-8", xml_declaration=True)
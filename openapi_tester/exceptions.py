@@ -1,5 +1,5 @@
 import json
-from typing import Any
+from typing import Any, List, Optional
 
 from openapi_tester.schema_converter import SchemaToPythonConverter
 
@@ -7,6 +7,9 @@ from openapi_tester.schema_converter import SchemaToPythonConverter
 class DocumentationError(AssertionError):
     """
     Custom exception raised when package tests fail.
+
+    The error message is only rendered when the error is displayed, since converting the schema to an example item
+    is expensive, and errors are often raised and handled without ever being displayed.
     """
 
     def __init__(
@@ -16,17 +19,53 @@ class DocumentationError(AssertionError):
         schema: dict,
         hint: str = "",
         reference: str = "",
+        pointer: str = "",
     ) -> None:
-        converted_schema = SchemaToPythonConverter(schema or {}).result
-        super().__init__(
-            self.format(
-                response=self._sort_data(response),
+        super().__init__()
+        self.message = message
+        self.response = response
+        self.schema = schema
+        self.hint = hint
+        self.reference = reference
+        self.pointer = pointer
+        self._rendered_message: Optional[str] = None
+
+    @property  # type: ignore
+    def args(self) -> tuple:  # type: ignore
+        return (str(self),)
+
+    @args.setter
+    def args(self, value: tuple) -> None:
+        self._rendered_message = value[0] if value else ""
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.message!r})"
+
+    def __str__(self) -> str:
+        if self._rendered_message is None:
+            converted_schema = SchemaToPythonConverter(self.schema or {}).result
+            self._rendered_message = self.format(
+                response=self._sort_data(self.response),
                 example_item=self._sort_data(converted_schema),
-                hint=hint,
-                message=message,
-                reference=reference,
+                hint=self.hint,
+                message=self.message,
+                reference=self.reference,
             )
-        )
+        return self._rendered_message
+
+    def to_dict(self) -> dict:
+        """
+        Returns the error as a JSON serializable dict.
+
+        The pointer is a JSON pointer to the mismatched value in the tested data.
+        """
+        return {
+            "pointer": self.pointer,
+            "message": self.message,
+            "expected": self.schema,
+            "received": self.response,
+            "hint": self.hint,
+        }
 
     @staticmethod
     def _sort_data(data_object: Any) -> Any:
@@ -57,6 +96,25 @@ class DocumentationError(AssertionError):
         return "".join(msg)
 
 
+class DocumentationErrors(DocumentationError):
+    """
+    Custom exception raised when errors are collected, and package tests fail with one or more errors.
+    """
+
+    def __init__(self, errors: List[DocumentationError]) -> None:
+        message = f"Found {len(errors)} documentation error{'s' if len(errors) != 1 else ''}."
+        super().__init__(message=message, response=None, schema={})
+        self.errors = errors
+
+    def __str__(self) -> str:
+        if self._rendered_message is None:
+            self._rendered_message = "\n".join([f"{self.message}\n", *(str(error) for error in self.errors)])
+        return self._rendered_message
+
+    def to_dict(self) -> dict:
+        return {"message": self.message, "errors": [error.to_dict() for error in self.errors]}
+
+
 class CaseError(AssertionError):
     """
     Custom exception raised when items are not cased correctly.
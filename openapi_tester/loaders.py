@@ -1,21 +1,49 @@
 import difflib
+import hashlib
 import json
+import logging
+import marshal
+import os
 import pathlib
 import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from functools import partial
 from json import dumps, loads
-from typing import Callable, Dict, List, Optional
-from urllib.parse import ParseResult
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple
+from urllib.parse import ParseResult, unquote
 
 import yaml
 from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
 from django.urls import Resolver404, resolve
 from openapi_spec_validator import openapi_v2_spec_validator, openapi_v3_spec_validator
 from prance.util.resolver import RefResolver
 from prance.util.url import ResolutionError
 from rest_framework.schemas.generators import EndpointEnumerator
 
-from openapi_tester.constants import PARAMETER_CAPTURE_REGEX
+from openapi_tester.constants import PARAMETER_CAPTURE_REGEX, SHARED_SCHEMA_ENV_VAR, SHARED_SCHEMA_HASH_ENV_VAR
 from openapi_tester.exceptions import OpenAPISchemaError
+from openapi_tester.shared_schema import attach_schema, export_schema
+
+logger = logging.getLogger("openapi_tester")
+
+# libyaml's loader is many times faster than the pure Python one, but PyYAML can be installed without it
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+JSON_EXTENSIONS = {".json"}
+YAML_EXTENSIONS = {".yaml", ".yml"}
+
+# always validate the schema, validate each version once and remember it on disk, validate it in a background thread,
+# or never validate it
+VALIDATION_POLICIES = ("always", "once", "background", "never")
+
+# settings that change how request paths are matched to schema paths
+ROUTE_SETTINGS = {"ROOT_URLCONF", "OPENAPI_TESTER", "SPECTACULAR_SETTINGS", "SWAGGER_SETTINGS"}
+
+# keywords holding example data rather than schemas, where a `pattern` key is not a regular expression
+PATTERN_FREE_KEYWORDS = {"example", "examples", "default", "enum"}
 
 
 def handle_recursion_limit(schema: dict) -> Callable:
@@ -60,10 +88,38 @@ class BaseSchemaLoader:
     """
 
     base_path = "/"
+    route_cache_size = 1024
 
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[str] = None, preserve_references: bool = False, validation: str = "always"):
+        """
+        :param cache_dir: An optional directory for caching processed schemas between test runs
+        :param preserve_references: Resolve references as they're used, instead of inlining them when loading
+        :param validation: When to validate the schema against the OpenAPI specification, one of VALIDATION_POLICIES
+        """
         super().__init__()
+        if validation not in VALIDATION_POLICIES:
+            raise ImproperlyConfigured(
+                f"Unknown schema validation policy `{validation}`, expected one of: {', '.join(VALIDATION_POLICIES)}"
+            )
+        self.validation = validation
+        self._validation_thread: Optional[threading.Thread] = None
+        self._validation_error: Optional[Exception] = None
         self.schema: Optional[dict] = None
+        self.cache_dir = str(cache_dir) if cache_dir else None
+        self.preserve_references = preserve_references
+        # concrete request paths -> schema paths, bounded and evicted in least-recently-used order
+        self._route_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._endpoint_paths: Optional[List[str]] = None
+        # a schema loaded to check a shared schema against, and the hash of the schema last processed
+        self._loaded_schema: Optional[dict] = None
+        self._source_hash: Optional[str] = None
+        # the schema replaced by the last reload, and the schema paths that changed
+        self._last_change: Optional[Tuple[dict, FrozenSet[str]]] = None
+        setting_changed.connect(self._handle_setting_changed)
+
+    def _handle_setting_changed(self, setting: str, **kwargs: Any) -> None:
+        if setting in ROUTE_SETTINGS:
+            self.clear_route_cache()
 
     def load_schema(self) -> dict:
         """
@@ -74,11 +130,79 @@ class BaseSchemaLoader:
     def get_schema(self) -> dict:
         """
         Returns OpenAPI schema.
+
+        If another process has exported a processed schema from the same source, the schema is attached to, and not
+        loaded and processed again.
         """
+        if self._validation_error is not None:
+            raise self._validation_error
+        if self.schema is None:
+            self.schema = self.attach_shared_schema()
         if self.schema is None:
-            self.set_schema(self.load_schema())
+            # a schema loaded to check a shared schema against is used, rather than loaded again
+            schema, self._loaded_schema = self._loaded_schema, None
+            self.set_schema(schema if schema is not None else self.load_schema())
         return self.schema  # type: ignore
 
+    def get_schema_source(self) -> str:
+        """
+        Returns a string identifying where the schema is loaded from.
+        """
+        return self.__class__.__name__
+
+    def get_source_hash(self) -> str:
+        """
+        Returns a hash of the schema as it is now, before it's processed, to check that a shared schema is current.
+
+        Generated schemas have to be generated to hash them, so the hash returned by `export_shared_schema` is used
+        instead, if it's passed on in the OPENAPI_TESTER_SHARED_SCHEMA_HASH environment variable. Otherwise the schema
+        is generated, and kept, so it isn't generated again if the shared schema turns out to be outdated.
+        """
+        source_hash = os.environ.get(SHARED_SCHEMA_HASH_ENV_VAR)
+        if source_hash:
+            return source_hash
+        if self._loaded_schema is None:
+            self._loaded_schema = self.load_schema()
+        return self.get_schema_hash(self._loaded_schema)
+
+    def _get_shared_schema_source(self) -> str:
+        return f"{self.get_schema_source()}:{'references' if self.preserve_references else 'de-referenced'}"
+
+    def export_shared_schema(self, file_path: str) -> str:
+        """
+        Writes the processed schema to a file that loaders in other processes can attach to.
+
+        Exporting the schema from a pytest-xdist controller and pointing the workers to the file through the
+        OPENAPI_TESTER_SHARED_SCHEMA environment variable means the schema is only processed once per test run.
+
+        :return: The hash of the schema it was processed from. Passing it on in the OPENAPI_TESTER_SHARED_SCHEMA_HASH
+            environment variable means generated schemas don't have to be generated to check the shared schema
+        """
+        schema = self.get_schema()
+        source_hash = self._source_hash
+        if source_hash is None:
+            # the schema was attached to, not loaded
+            source_hash = self.get_schema_hash(self.load_schema())
+        export_schema(schema, file_path, source=self._get_shared_schema_source(), source_hash=source_hash)
+        return source_hash
+
+    def attach_shared_schema(self, file_path: Optional[str] = None) -> Optional[dict]:
+        """
+        Returns a schema exported by another process, if one exists for this loader's schema source, and it was
+        exported from the current version of the schema.
+
+        :param file_path: The exported schema file. Defaults to the OPENAPI_TESTER_SHARED_SCHEMA environment variable
+        """
+        file_path = file_path or os.environ.get(SHARED_SCHEMA_ENV_VAR)
+        if not file_path or not os.path.exists(file_path):
+            return None
+        schema = attach_schema(file_path, source=self._get_shared_schema_source(), source_hash=self.get_source_hash())
+        if schema is None:
+            logger.debug("Ignoring shared schema %s, it wasn't exported from this schema", file_path)
+        else:
+            logger.debug("Attached to shared schema %s", file_path)
+        return schema
+
     def de_reference_schema(self, schema: dict) -> dict:
         try:
             url = schema["basePath"] if "basePath" in schema else self.base_path
@@ -95,14 +219,20 @@ class BaseSchemaLoader:
             raise OpenAPISchemaError(e.args[0]) from e
 
     def normalize_schema_paths(self, schema: dict) -> Dict[str, dict]:
-        normalized_paths: Dict[str, dict] = {}
-        for key, value in schema["paths"].items():
-            if "{" in key:
-                normalized_paths[key] = value
-            else:
-                normalized_paths[self.parameterize_path(key)] = value
+        normalized_paths = {self.normalize_schema_path(key): value for key, value in schema["paths"].items()}
         return {**schema, "paths": normalized_paths}
 
+    def normalize_schema_path(self, key: str) -> str:
+        return key if "{" in key else self.parameterize_path(key)
+
+    def get_changed_paths(self, schema: Optional[dict]) -> Optional[FrozenSet[str]]:
+        """
+        Returns the paths that changed since `schema` was replaced by a reload, or None if anything may have changed.
+        """
+        if schema is not None and self._last_change is not None and self._last_change[0] is schema:
+            return self._last_change[1]
+        return None
+
     @staticmethod
     def validate_schema(schema: dict):
         if "openapi" in schema:
@@ -111,30 +241,236 @@ class BaseSchemaLoader:
             validator = openapi_v2_spec_validator
         validator.validate(schema)
 
+    @staticmethod
+    def validate_patterns(schema: dict) -> None:
+        """
+        Checks that every `pattern` in the schema is a valid regular expression.
+
+        :raises: OpenAPISchemaError listing every invalid pattern, with its JSON pointer
+        """
+        errors = []
+        seen = set()
+        # sections are (section, JSON pointer, whether the section's keys are property names rather than keywords)
+        stack: List[Tuple[Any, str, bool]] = [(schema, "#", False)]
+        while stack:
+            section, pointer, is_property_map = stack.pop()
+            if id(section) in seen:
+                continue
+            seen.add(id(section))
+            items = section.items() if isinstance(section, dict) else enumerate(section)
+            for key, value in items:
+                child_pointer = f"{pointer}/{str(key).replace('~', '~0').replace('/', '~1')}"
+                if key == "pattern" and isinstance(value, str) and not is_property_map:
+                    try:
+                        re.compile(value)
+                    except re.error as e:
+                        errors.append(f"{child_pointer}: `{value}` ({e})")
+                elif isinstance(value, (dict, list)) and (is_property_map or key not in PATTERN_FREE_KEYWORDS):
+                    stack.append((value, child_pointer, key == "properties" and not is_property_map))
+        if errors:
+            pretty_errors = "\n\t• ".join(sorted(errors))
+            raise OpenAPISchemaError(f"The OpenAPI schema contains invalid regex patterns:\n\n\t• {pretty_errors}")
+
+    def get_schema_hash(self, schema: dict) -> str:
+        """
+        Returns a hash of the schema source, used to key the schema cache.
+        """
+        return hashlib.sha256(json.dumps(schema, sort_keys=True, default=str).encode()).hexdigest()
+
+    def get_cache_path(self, schema: dict) -> str:
+        """
+        Returns the path of the cache file for a schema.
+
+        The key includes the package version, since the processed schema depends on how it was processed.
+        """
+        from openapi_tester import __version__
+
+        key = hashlib.sha256(
+            f"{__version__}:{marshal.version}:{self.preserve_references}:{self.get_schema_hash(schema)}".encode()
+        ).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.marshal")  # type: ignore
+
+    def read_schema_cache(self, schema: dict) -> Optional[dict]:
+        """
+        Returns the cached processed and validated schema, if there is one.
+
+        Files that can't be read are treated as cache misses, and the schema is processed again.
+        """
+        cache_path = self.get_cache_path(schema)
+        try:
+            with open(cache_path, "rb") as f:
+                cached_schema = marshal.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:  # noqa: B902
+            cached_schema = None
+        if not isinstance(cached_schema, dict):
+            logger.warning("Ignoring unreadable schema cache file %s", cache_path)
+            return None
+        logger.debug("Loaded processed schema from %s", cache_path)
+        return cached_schema
+
+    def write_schema_cache(self, schema: dict, processed_schema: dict) -> None:
+        """
+        Caches a processed and validated schema.
+
+        The schema is stored with marshal, which only handles plain data, so loading a cache file can't run code.
+        Schemas holding other values, e.g., YAML dates, aren't cached. The file is written to a temporary path first,
+        so concurrent processes never read a partially written file.
+        """
+        try:
+            data = marshal.dumps(processed_schema)
+        except ValueError:
+            logger.debug("Not caching the processed schema, it holds values that can't be marshalled")
+            return
+        cache_path = self.get_cache_path(schema)
+        os.makedirs(self.cache_dir, exist_ok=True)  # type: ignore
+        with tempfile.NamedTemporaryFile(dir=self.cache_dir, suffix=".tmp", delete=False) as f:
+            f.write(data)
+        os.replace(f.name, cache_path)
+
+    def resolve_reference(self, schema_section: dict) -> dict:
+        """
+        Follows local `$ref`s until it reaches a schema section that is not a reference.
+
+        Only used when references are preserved; de-referenced schemas have no references left to follow.
+        """
+        seen = set()
+        while isinstance(schema_section, dict) and "$ref" in schema_section:
+            reference = schema_section["$ref"]
+            if not reference.startswith("#/"):
+                raise OpenAPISchemaError(
+                    f"Unable to resolve `{reference}`. Only local references are supported when references are "
+                    f"preserved."
+                )
+            if reference in seen:
+                raise OpenAPISchemaError(f"Circular reference `{reference}` does not resolve to a schema section")
+            seen.add(reference)
+            schema_section = self.schema  # type: ignore
+            try:
+                for key in reference[2:].split("/"):
+                    schema_section = schema_section[unquote(key).replace("~1", "/").replace("~0", "~")]
+            except (KeyError, TypeError) as e:
+                raise OpenAPISchemaError(f"Unable to resolve `{reference}`") from e
+        return schema_section
+
     def set_schema(self, schema: dict) -> None:
         """
         Sets self.schema and self.original_schema.
+
+        If a cache directory is configured, de-referencing and validation is skipped for schemas that have been
+        processed before. If references are preserved, they are left in the schema, to be resolved as they're used.
         """
-        de_referenced_schema = self.de_reference_schema(schema)
-        self.validate_schema(de_referenced_schema)
-        self.schema = self.normalize_schema_paths(de_referenced_schema)
+        self._source_hash = self.get_schema_hash(schema)
+        processed_schema = self.read_schema_cache(schema) if self.cache_dir else None
+        if processed_schema is None:
+            processed_schema = schema if self.preserve_references else self.de_reference_schema(schema)
+            on_valid = partial(self.write_schema_cache, schema, processed_schema) if self.cache_dir else None
+            self.check_schema(processed_schema, schema, on_valid=on_valid)
+        self.schema = self.normalize_schema_paths(processed_schema)
+
+    def check_schema(self, schema: dict, source_schema: dict, on_valid: Optional[Callable[[], None]] = None) -> None:
+        """
+        Validates a processed schema against the OpenAPI specification, according to the validation policy.
+
+        :param schema: The processed schema
+        :param source_schema: The schema it was processed from, which identifies it for the "once" policy
+        :param on_valid: Called once the schema is known to be valid. Never called for schemas that aren't validated
+        """
+        if self.validation == "once":
+            marker_path = self.get_validation_marker_path(source_schema)
+            if not os.path.exists(marker_path):
+                self.validate_schema(schema)
+                self.validate_patterns(schema)
+                os.makedirs(os.path.dirname(marker_path), exist_ok=True)
+                open(marker_path, "w").close()
+        elif self.validation == "background":
+            # the result of validating a previous version doesn't apply to this one
+            self._join_validation()
+            self._validation_error = None
+            self._validation_thread = threading.Thread(
+                target=self._validate_in_background, args=(schema, on_valid), name="openapi-tester-validation"
+            )
+            self._validation_thread.daemon = True
+            self._validation_thread.start()
+            return
+        elif self.validation == "always":
+            self.validate_schema(schema)
+            self.validate_patterns(schema)
+        else:
+            return
+        if on_valid is not None:
+            on_valid()
+
+    def _validate_in_background(self, schema: dict, on_valid: Optional[Callable[[], None]]) -> None:
+        try:
+            self.validate_schema(schema)
+            self.validate_patterns(schema)
+        except Exception as e:  # noqa: B902
+            self._validation_error = e
+            return
+        if on_valid is not None:
+            on_valid()
+
+    def wait_for_validation(self, timeout: Optional[float] = None) -> None:
+        """
+        Waits for a schema being validated in the background, and raises its validation error, if it's invalid.
+        """
+        if self._validation_thread is not None:
+            self._validation_thread.join(timeout)
+        if self._validation_error is not None:
+            raise self._validation_error
+
+    def _join_validation(self) -> None:
+        if self._validation_thread is not None:
+            self._validation_thread.join()
+            self._validation_thread = None
+
+    def get_validation_marker_path(self, schema: dict) -> str:
+        """
+        Returns the path of the file that marks a schema as valid, for the "once" validation policy.
+        """
+        directory = self.cache_dir or os.path.join(tempfile.gettempdir(), "drf-openapi-tester")
+        mode = "references" if self.preserve_references else "de-referenced"
+        return os.path.join(directory, f"{self.get_schema_hash(schema)}.{mode}.valid")
 
     def parameterize_path(self, de_parameterized_path: str) -> str:
         """
         Returns the appropriate endpoint route.
+
+        Results are cached by concrete path, as they don't depend on anything but the URLconf.
         """
+        if de_parameterized_path in self._route_cache:
+            self._route_cache.move_to_end(de_parameterized_path)
+            return self._route_cache[de_parameterized_path]
         path, resolved_path = self.resolve_path(de_parameterized_path)
         for parameter in list(re.findall(PARAMETER_CAPTURE_REGEX, path)):
             parameter_name = parameter.replace("{", "").replace("}", "")
             path = path.replace(resolved_path.kwargs[parameter_name], parameter_name)
+        self._route_cache[de_parameterized_path] = path
+        if len(self._route_cache) > self.route_cache_size:
+            self._route_cache.popitem(last=False)
         return path
 
-    @staticmethod
-    def get_endpoint_paths() -> List[str]:
+    def clear_route_cache(self) -> None:
+        """
+        Clears cached path resolutions and endpoint paths.
+
+        Called automatically when the URLconf or path prefix settings change, and should be called if the URLconf
+        changes in any other way.
+        """
+        self._route_cache.clear()
+        self._endpoint_paths = None
+
+    def get_endpoint_paths(self) -> List[str]:
         """
         Returns a list of endpoint paths.
+
+        Enumerating the URLconf is slow, so the paths are only enumerated once per loader.
         """
-        return list({endpoint[0] for endpoint in EndpointEnumerator().get_api_endpoints()})
+        if self._endpoint_paths is None:
+            self._endpoint_paths = list({endpoint[0] for endpoint in EndpointEnumerator().get_api_endpoints()})
+        return self._endpoint_paths
 
     def resolve_path(self, endpoint_path: str) -> tuple:
         """
@@ -177,12 +513,16 @@ class DrfYasgSchemaLoader(BaseSchemaLoader):
     Loads OpenAPI schema generated by drf_yasg.
     """
 
-    def __init__(self) -> None:
-        super().__init__()
+    def __init__(
+        self, cache_dir: Optional[str] = None, preserve_references: bool = False, validation: str = "always"
+    ) -> None:
+        super().__init__(cache_dir=cache_dir, preserve_references=preserve_references, validation=validation)
         from drf_yasg.generators import OpenAPISchemaGenerator
         from drf_yasg.openapi import Info
 
         self.schema_generator = OpenAPISchemaGenerator(info=Info(title="", default_version=""))
+        self._path_prefix: Optional[str] = None
+        self.path_prefix_computations = 0
 
     def load_schema(self) -> dict:
         """
@@ -198,9 +538,18 @@ class DrfYasgSchemaLoader(BaseSchemaLoader):
         Drf_yasg `cleans` schema paths by finding recurring path patterns,
         and cutting them out of the generated openapi schema.
         For example, `/api/v1/example` might then just become `/example`
+
+        The prefix is computed once, and recomputed if the URLconf changes. `path_prefix_computations` counts how many
+        times it has been computed.
         """
+        if self._path_prefix is None:
+            self._path_prefix = self.schema_generator.determine_path_prefix(self.get_endpoint_paths())
+            self.path_prefix_computations += 1
+        return self._path_prefix
 
-        return self.schema_generator.determine_path_prefix(self.get_endpoint_paths())
+    def clear_route_cache(self) -> None:
+        super().clear_route_cache()
+        self._path_prefix = None
 
     def resolve_path(self, route: str) -> tuple:
         de_parameterized_path, resolved_path = super().resolve_path(route)
@@ -215,8 +564,10 @@ class DrfSpectacularSchemaLoader(BaseSchemaLoader):
     Loads OpenAPI schema generated by drf_spectacular.
     """
 
-    def __init__(self) -> None:
-        super().__init__()
+    def __init__(
+        self, cache_dir: Optional[str] = None, preserve_references: bool = False, validation: str = "always"
+    ) -> None:
+        super().__init__(cache_dir=cache_dir, preserve_references=preserve_references, validation=validation)
         from drf_spectacular.generators import SchemaGenerator
 
         self.schema_generator = SchemaGenerator()
@@ -249,9 +600,30 @@ class StaticSchemaLoader(BaseSchemaLoader):
     Loads OpenAPI schema from a static file.
     """
 
-    def __init__(self, path: str):
-        super().__init__()
+    def __init__(
+        self,
+        path: str,
+        cache_dir: Optional[str] = None,
+        preserve_references: bool = False,
+        watch: bool = False,
+        watch_interval: float = 1.0,
+        validation: str = "always",
+    ):
+        """
+        :param path: The path to a YAML or JSON schema file
+        :param watch: Poll the file for changes, and reload the paths and components that changed
+        :param watch_interval: The minimum number of seconds between polls
+        """
+        super().__init__(cache_dir=cache_dir, preserve_references=preserve_references, validation=validation)
         self.path = path if not isinstance(path, pathlib.PosixPath) else str(path)
+        self._source: Optional[Tuple[dict, str]] = None
+        # seconds spent parsing the schema file, the last time it was loaded
+        self.parse_time: Optional[float] = None
+        self.watch = watch
+        self.watch_interval = watch_interval
+        self._last_poll = 0.0
+        # (modification time, size) of the file, when it was last read
+        self._file_signature: Optional[Tuple[int, int]] = None
 
     def load_schema(self) -> dict:
         """
@@ -262,6 +634,179 @@ class StaticSchemaLoader(BaseSchemaLoader):
         """
         if not self.path:
             raise ImproperlyConfigured("Unable to read the schema file. Please make sure the path setting is correct.")
-        with open(self.path) as f:
+        with open(self.path, "rb") as f:
+            stat = os.fstat(f.fileno())
             content = f.read()
-            return json.loads(content) if ".json" in self.path else yaml.load(content, Loader=yaml.FullLoader)
+        self._file_signature = (stat.st_mtime_ns, stat.st_size)
+        self._last_poll = time.monotonic()
+        return self.parse_schema(content)
+
+    def parse_schema(self, content: bytes) -> dict:
+        start = time.perf_counter()
+        if self.get_schema_format(content) == "json":
+            schema = json.loads(content)
+        else:
+            try:
+                schema = yaml.load(content, Loader=YamlLoader)
+            except yaml.YAMLError:
+                if YamlLoader is yaml.SafeLoader:
+                    raise
+                # libyaml is stricter than the pure Python loader about some flow style syntax, e.g., `key:{`
+                logger.debug("Falling back to the pure Python YAML loader for %s", self.path)
+                schema = yaml.load(content, Loader=yaml.SafeLoader)
+        self.parse_time = time.perf_counter() - start
+        logger.debug("Parsed %s in %.3fs", self.path, self.parse_time)
+        self._source = (schema, hashlib.sha256(content).hexdigest())
+        return schema
+
+    def get_schema(self) -> dict:
+        if self.watch and self.schema is not None and time.monotonic() - self._last_poll >= self.watch_interval:
+            self.reload_schema()
+        return super().get_schema()
+
+    def attach_shared_schema(self, file_path: Optional[str] = None) -> Optional[dict]:
+        # a watched schema is compared to the file it was loaded from, so it can't be shared
+        return None if self.watch else super().attach_shared_schema(file_path)
+
+    def reload_schema(self) -> bool:
+        """
+        Reloads the schema if the file changed since it was last read.
+
+        Only the paths that changed, or that reference components that changed, are processed again. The rest of the
+        processed schema is reused as is.
+
+        :return: Whether the schema changed
+        """
+        self._last_poll = time.monotonic()
+        stat = os.stat(self.path)
+        if (stat.st_mtime_ns, stat.st_size) == self._file_signature:
+            return False
+        previous_source, previous_schema = self._source, self.schema
+        try:
+            schema = self.load_schema()
+            if previous_source is None or self._source[1] == previous_source[1]:  # type: ignore
+                return False
+            logger.debug("Reloading changed schema %s", self.path)
+            changed_paths = self.get_changed_schema_paths(previous_source[0], schema)
+            # only the changed paths would be validated, so an invalid schema is processed again as a whole
+            self._join_validation()
+            if changed_paths is None or self._validation_error is not None:
+                self._last_change = None
+                self.set_schema(schema)
+            else:
+                self._last_change = (previous_schema, self.update_schema(schema, changed_paths))  # type: ignore
+        except Exception:
+            # keep the schema that was last loaded successfully, and try again on the next poll
+            self._source, self._file_signature = previous_source, None
+            raise
+        return True
+
+    @staticmethod
+    def get_changed_schema_paths(old_schema: dict, new_schema: dict) -> Optional[Set[str]]:
+        """
+        Compares two versions of a raw schema.
+
+        :return: The keys of paths that were added, removed, or changed, or that reference components that changed,
+            or None if anything but paths and components changed
+        """
+        component_sections = {"components", "definitions", "parameters", "responses"}
+        if any(
+            old_schema.get(key) != new_schema.get(key)
+            for key in {*old_schema, *new_schema} - {"paths", *component_sections}
+        ):
+            return None
+
+        def components(schema: dict) -> Dict[str, Any]:
+            result = {}
+            for section in component_sections - {"components"}:
+                for name, component in schema.get(section, {}).items():
+                    result[f"#/{section}/{name}"] = component
+            for section, section_components in schema.get("components", {}).items():
+                for name, component in section_components.items():
+                    result[f"#/components/{section}/{name}"] = component
+            return result
+
+        def references(section: Any) -> Set[str]:
+            found, stack = set(), [section]
+            while stack:
+                node = stack.pop()
+                if isinstance(node, dict):
+                    if isinstance(node.get("$ref"), str):
+                        found.add(node["$ref"])
+                    stack.extend(node.values())
+                elif isinstance(node, list):
+                    stack.extend(node)
+            return found
+
+        old_components, new_components = components(old_schema), components(new_schema)
+        changed = {
+            name
+            for name in {*old_components, *new_components}
+            if old_components.get(name, None) != new_components.get(name, None)
+        }
+        # components referencing changed components changed too
+        component_references = {name: references(component) for name, component in new_components.items()}
+        while True:
+            dependents = {name for name, refs in component_references.items() if refs & changed} - changed
+            if not dependents:
+                break
+            changed |= dependents
+
+        old_paths, new_paths = old_schema["paths"], new_schema["paths"]
+        changed_paths = {key for key in old_paths if key not in new_paths}
+        for key, path_item in new_paths.items():
+            if path_item != old_paths.get(key) or references(path_item) & changed:
+                changed_paths.add(key)
+        return changed_paths
+
+    def update_schema(self, schema: dict, changed_paths: Set[str]) -> FrozenSet[str]:
+        """
+        Processes the changed paths of a new version of the schema, and reuses the processed paths that didn't change.
+
+        :return: The normalized keys of the paths that changed
+        """
+        paths = schema["paths"]
+        changed_schema = {**schema, "paths": {key: paths[key] for key in paths if key in changed_paths}}
+        processed_schema = changed_schema if self.preserve_references else self.de_reference_schema(changed_schema)
+        self.check_schema(processed_schema, changed_schema)
+        processed_paths = self.normalize_schema_paths(processed_schema)["paths"]
+        previous_paths = self.schema["paths"]  # type: ignore
+        updated_paths = {}
+        for key in paths:
+            normalized_key = self.normalize_schema_path(key)
+            updated_paths[normalized_key] = (
+                processed_paths[normalized_key] if key in changed_paths else previous_paths[normalized_key]
+            )
+        self.schema = {**processed_schema, "paths": updated_paths}
+        return frozenset(processed_paths) | frozenset(previous_paths.keys() - updated_paths.keys())
+
+    def get_schema_format(self, content: bytes) -> str:
+        """
+        Returns "json" or "yaml", from the file extension, or for other extensions, from the content.
+
+        JSON is a subset of YAML, but the JSON parser is much faster, so content that looks like JSON is parsed as JSON.
+        """
+        extension = os.path.splitext(self.path)[1].lower()
+        if extension in JSON_EXTENSIONS:
+            return "json"
+        if extension in YAML_EXTENSIONS:
+            return "yaml"
+        return "json" if content.lstrip(b"\xef\xbb\xbf \t\r\n")[:1] in (b"{", b"[") else "yaml"
+
+    def get_schema_source(self) -> str:
+        return f"{self.__class__.__name__}:{os.path.abspath(self.path)}"
+
+    def get_source_hash(self) -> str:
+        """
+        Returns a hash of the schema file contents, without parsing it.
+        """
+        with open(self.path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+
+    def get_schema_hash(self, schema: dict) -> str:
+        """
+        Returns a hash of the schema file contents, if the schema was loaded from file.
+        """
+        if self._source is not None and self._source[0] is schema:
+            return self._source[1]
+        return super().get_schema_hash(schema)
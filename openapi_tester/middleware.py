@@ -0,0 +1,197 @@
+"""
+Django middleware that validates a sample of live responses against the OpenAPI schema.
+
+Add it to your settings to catch schema drift in data your test fixtures never produce:
+
+    MIDDLEWARE = [
+        "openapi_tester.middleware.ResponseValidationMiddleware",
+        ...
+    ]
+
+Sampled responses are validated by a background thread, so requests only pay for copying a reference to the response
+body onto a queue. When the queue is full, samples are dropped rather than slowing down requests.
+"""
+import json
+import logging
+import os
+import queue
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from django.core.exceptions import MiddlewareNotUsed
+from django.dispatch import Signal
+from django.http import HttpRequest, HttpResponse
+
+from openapi_tester.configuration import get_setting, get_settings_options
+from openapi_tester.schema_tester import SchemaTester
+
+logger = logging.getLogger("openapi_tester")
+
+# sent with the operation, the error, and the number of errors for the operation suppressed since the last report
+response_validation_failed = Signal()
+
+# (method, URL pattern, status code), used to group errors for reporting
+ReportKey = Tuple[str, str, str]
+# (report key, path, method, status code, response body)
+Sample = Tuple[ReportKey, str, str, int, bytes]
+
+
+class BackgroundValidator:
+    """
+    Validates responses on a background thread, and reports errors at most once per operation per report interval.
+    """
+
+    def __init__(
+        self, tester: SchemaTester, queue_size: int = 100, report_interval: float = 60.0, max_report_keys: int = 1000
+    ) -> None:
+        """
+        :param tester: The schema tester used to validate responses. It's only ever used by the background thread
+        :param queue_size: The number of responses that can wait to be validated before new samples are dropped
+        :param report_interval: The minimum number of seconds between reports of errors for the same operation
+        :param max_report_keys: The number of operations whose reports are rate limited, before the operations that
+            were reported the longest ago are forgotten
+        """
+        self.tester = tester
+        self.queue: "queue.Queue[Optional[Sample]]" = queue.Queue(maxsize=queue_size)
+        self.report_interval = report_interval
+        self.max_report_keys = max_report_keys
+        self.validated = 0
+        self.dropped = 0
+        # report key -> [time of last report, errors since the last report], in the order they were last reported
+        self.errors: Dict[Any, List[Any]] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def submit(self, sample: Sample) -> bool:
+        """
+        Queues a response to be validated, unless the queue is full.
+
+        :return: Whether the response was queued
+        """
+        self.start()
+        try:
+            self.queue.put_nowait(sample)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+                dropped = self.dropped
+            self.report("dropped", f"Dropped {dropped} sampled responses, the validation queue is full")
+            return False
+        return True
+
+    def start(self) -> None:
+        """
+        Starts the background thread, if it isn't running in this process.
+
+        Threads don't survive forking, so the thread is started by the first sample in each worker process.
+        """
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid != os.getpid():
+                self._thread = threading.Thread(target=self.run, name="openapi-tester-validator", daemon=True)
+                self._thread.start()
+                self._pid = os.getpid()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Validates the responses that are already queued, and stops the background thread.
+        """
+        if self._thread is not None and self._pid == os.getpid():
+            self.queue.put(None)
+            self._thread.join(timeout)
+        self._thread = self._pid = None
+
+    def run(self) -> None:
+        while True:
+            sample = self.queue.get()
+            try:
+                if sample is None:
+                    return
+                self.validate(*sample)
+            finally:
+                self.queue.task_done()
+
+    def validate(self, key: ReportKey, path: str, method: str, status_code: int, content: bytes) -> None:
+        try:
+            self.tester.validate_data(path, method, status_code, json.loads(content))
+        except AssertionError as error:
+            self.report(
+                key,
+                f"{method.upper()} {path} returned a {status_code} response that doesn't match the "
+                f"OpenAPI schema:\n\n{error}",
+                error=error,
+            )
+        except Exception as error:  # noqa: B902
+            self.report(key, f"Failed to validate the {status_code} response to {method.upper()} {path}", error=error)
+        finally:
+            self.validated += 1
+
+    def report(self, key: Any, message: str, error: Optional[Exception] = None) -> None:
+        """
+        Logs an error, and sends the `response_validation_failed` signal, unless the same key was reported recently.
+
+        Called from both request threads and the background thread.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self.errors.get(key)
+            if entry is not None and now - entry[0] < self.report_interval:
+                entry[1] += 1
+                return
+            suppressed = entry[1] if entry is not None else 0
+            self.errors.pop(key, None)
+            while len(self.errors) >= self.max_report_keys:
+                del self.errors[next(iter(self.errors))]
+            self.errors[key] = [now, 0]
+        if suppressed:
+            message += f"\n\n{suppressed} similar errors were suppressed"
+        if error is None or isinstance(error, AssertionError):
+            logger.warning(message)
+        else:
+            logger.error(message, exc_info=error)
+        if error is not None:
+            response_validation_failed.send(sender=self.__class__, operation=key, error=error, suppressed=suppressed)
+
+
+class ResponseValidationMiddleware:
+    """
+    Validates a sample of JSON responses in the background, and reports schema mismatches through logging and the
+    `response_validation_failed` signal.
+
+    The schema tester is configured by the OPENAPI_TESTER setting, and sampling by its SAMPLE_RATE (0.01),
+    SAMPLE_QUEUE_SIZE (100), and REPORT_INTERVAL (60 seconds) keys.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+        self.sample_rate = float(get_setting("SAMPLE_RATE", 0.01))
+        if self.sample_rate <= 0:
+            raise MiddlewareNotUsed()
+        self.validator = BackgroundValidator(
+            SchemaTester(**get_settings_options()),
+            queue_size=get_setting("SAMPLE_QUEUE_SIZE", 100),
+            report_interval=get_setting("REPORT_INTERVAL", 60.0),
+        )
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        response = self.get_response(request)
+        if random.random() < self.sample_rate and self.should_validate(request, response):
+            key = (request.method.lower(), request.resolver_match.route, str(response.status_code))
+            self.validator.submit((key, request.path_info, request.method, response.status_code, response.content))
+        return response
+
+    @staticmethod
+    def should_validate(request: HttpRequest, response: HttpResponse) -> bool:
+        """
+        Only JSON responses to requests that matched a URL pattern are validated, so every report key is a pattern.
+        Responses for unknown paths, e.g., 404s, would otherwise add a key per path.
+        """
+        return (
+            request.resolver_match is not None
+            and not response.streaming
+            and response.get("Content-Type", "").startswith("application/json")
+        )
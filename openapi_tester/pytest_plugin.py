@@ -0,0 +1,204 @@
+"""
+Pytest plugin providing a session-scoped schema tester.
+
+Enable it in your root conftest.py:
+
+    pytest_plugins = ["openapi_tester.pytest_plugin"]
+"""
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import pytest
+
+from openapi_tester.configuration import get_case_tester, get_settings_options
+from openapi_tester.coverage import EndpointCoverage
+from openapi_tester.schema_tester import SchemaTester
+
+# number of operations listed in the terminal summary, slowest first
+SLOWEST_OPERATIONS = 5
+
+
+def pytest_addoption(parser: Any) -> None:
+    parser.addini("openapi_tester_schema_file_path", "Path to a static OpenAPI schema file")
+    parser.addini(
+        "openapi_tester_case_tester",
+        "Case tester for response keys: camel_case, kebab_case, pascal_case, snake_case, or an import path",
+    )
+    parser.addini("openapi_tester_ignore_case", "Keys to ignore when testing the case of response keys", type="args")
+    parser.addini("openapi_tester_schema_cache_dir", "Directory for caching processed schemas between test runs")
+    parser.addini("openapi_tester_preserve_references", "Resolve schema references as they are used", type="bool")
+    parser.addini("openapi_tester_watch_schema", "Reload the static schema file when it changes", type="bool")
+    parser.addini(
+        "openapi_tester_schema_validation",
+        "When to validate the schema against the OpenAPI specification: always, once, background, or never",
+    )
+    parser.addini(
+        "openapi_tester_coverage_report",
+        "Write a report of which documented responses were validated to this file, as JUnit XML if it ends with .xml, "
+        "otherwise as JSON",
+    )
+    parser.addini("openapi_tester_stats_report", "Write the time spent in each phase of validation to this JSON file")
+
+
+def pytest_configure(config: Any) -> None:
+    config.pluginmanager.register(SchemaTesterPlugin(config), "openapi_tester_session")
+
+
+def get_schema_tester_options(config: Any) -> Dict[str, Any]:
+    """
+    Returns the schema tester arguments configured in the OPENAPI_TESTER Django setting, and in the pytest ini file.
+
+    Options set in the ini file take precedence over the Django setting.
+    """
+    options = get_settings_options()
+    for key in options:
+        value = config.getini(f"openapi_tester_{key}")
+        if value:
+            options[key] = value
+    options["case_tester"] = get_case_tester(options["case_tester"])
+    return options
+
+
+class SchemaTesterPlugin:
+    """
+    Provides the `schema_tester` and `assert_response` fixtures, and reports how long the schema tester took.
+
+    Under pytest-xdist, workers send their results to the controller, which reports them, and writes the report files,
+    once for the whole test run.
+    """
+
+    def __init__(self, config: Any) -> None:
+        self.config = config
+        self.is_worker = hasattr(config, "workerinput")
+        self.load_time: Optional[float] = None
+        self.validation_time = 0.0
+        self.validation_count = 0
+        self.tester: Optional[SchemaTester] = None
+        # raised by a schema validated in the background
+        self.validation_error: Optional[str] = None
+
+    @pytest.fixture(scope="session")
+    def schema_tester(self) -> SchemaTester:
+        """
+        A schema tester shared by the whole test session, with its schema loaded once, up front.
+        """
+        tester = SchemaTester(**get_schema_tester_options(self.config))
+        start = time.perf_counter()
+        tester.loader.get_schema()
+        self.load_time = time.perf_counter() - start
+        self.tester = tester
+        return tester
+
+    @pytest.fixture
+    def assert_response(self, schema_tester: SchemaTester) -> Callable[..., None]:
+        """
+        Validates a response with the session schema tester. Takes the same arguments as `validate_response`.
+        """
+
+        def assert_response(response: Any, **kwargs: Any) -> None:
+            start = time.perf_counter()
+            try:
+                schema_tester.validate_response(response, **kwargs)
+            finally:
+                self.validation_time += time.perf_counter() - start
+                self.validation_count += 1
+
+        return assert_response
+
+    def pytest_sessionfinish(self, session: Any) -> None:
+        """
+        Fails the session if the schema was validated in the background, and turned out to be invalid.
+
+        In pytest-xdist workers, this also hands the results to the controller.
+        """
+        if self.tester is not None:
+            try:
+                self.tester.loader.wait_for_validation()
+            except Exception as e:  # noqa: B902
+                self.validation_error = str(e)
+            if self.is_worker:
+                self.config.workeroutput["openapi_tester"] = {
+                    "load_time": self.load_time,
+                    "validation_time": self.validation_time,
+                    "validation_count": self.validation_count,
+                    "validation_error": self.validation_error,
+                    "coverage": list(self.tester.coverage.counter.items()),
+                    "stats": self.tester.stats.get_timings(),
+                }
+        if self.validation_error is not None:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node: Any, error: Any) -> None:
+        """
+        Merges the results of a pytest-xdist worker.
+        """
+        output = getattr(node, "workeroutput", {}).get("openapi_tester")
+        if output is None:
+            return
+        if self.tester is None:
+            # the workers have validated the schema, the controller only needs it for the coverage report
+            self.tester = SchemaTester(**{**get_schema_tester_options(self.config), "schema_validation": "never"})
+        self.load_time = max(self.load_time or 0.0, output["load_time"] or 0.0)
+        self.validation_time += output["validation_time"]
+        self.validation_count += output["validation_count"]
+        self.validation_error = self.validation_error or output["validation_error"]
+        self.tester.coverage.merge(output["coverage"])
+        self.tester.stats.merge(output["stats"])
+
+    def pytest_terminal_summary(self, terminalreporter: Any) -> None:
+        if self.tester is None or self.is_worker:
+            return
+        lines: List[str] = [f"Schema loaded in {self.load_time:.2f}s"]
+        if self.validation_error is not None:
+            lines.append(f"The schema is invalid: {self.validation_error}")
+        if self.validation_count:
+            lines.append(f"{self.validation_count} responses validated in {self.validation_time:.2f}s")
+        lines += self.get_stats_lines()
+        if self.validation_error is None:
+            lines += self.get_coverage_lines()
+        terminalreporter.write_sep("-", "openapi-tester")
+        for line in lines:
+            terminalreporter.write_line(line)
+
+    def get_stats_lines(self) -> List[str]:
+        """
+        Lists the operations that took the longest to validate, and writes the full timing report, if configured.
+        """
+        stats = self.tester.stats  # type: ignore
+        operations = stats.get_operations()[:SLOWEST_OPERATIONS]
+        lines = ["Slowest responses:"] if operations else []
+        lines += [
+            f"  {entry['seconds']:.3f}s {entry['method'].upper()} {entry['path']} {entry['status_code']} "
+            f"({entry['phases']['resolve_path']['count']} validated)"
+            for entry in operations
+        ]
+        report_path = self.config.getini("openapi_tester_stats_report")
+        if report_path:
+            stats.write_json(report_path)
+            lines.append(f"Timing report written to {report_path}")
+        return lines
+
+    def get_coverage_lines(self) -> List[str]:
+        """
+        Summarizes which documented responses were validated, and writes the full coverage report, if configured.
+        """
+        report = self.tester.get_coverage_report()  # type: ignore
+        lines = [
+            f"{len(report['validated'])} of {report['documented']} documented responses validated "
+            f"({report['coverage']:.0%})"
+        ]
+        if report["undocumented"]:
+            lines.append("Validated responses that are not documented:")
+            lines += [
+                f"  {entry['method'].upper()} {entry['path']} {entry['status_code']}"
+                for entry in report["undocumented"]
+            ]
+        report_path = self.config.getini("openapi_tester_coverage_report")
+        if report_path:
+            if report_path.endswith(".xml"):
+                EndpointCoverage.write_junit(report, report_path)
+            else:
+                EndpointCoverage.write_json(report, report_path)
+            lines.append(f"Coverage report written to {report_path}")
+        return lines
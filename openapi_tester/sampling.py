@@ -0,0 +1,54 @@
+"""
+Array sampling policies.
+
+A sampling policy is a callable that receives the length of a response array, and returns the indices of the items
+that should be validated, in ascending order. By default every item is validated.
+"""
+import random
+from typing import Callable, Sequence
+
+ArraySampler = Callable[[int], Sequence[int]]
+
+
+def first_n(n: int) -> ArraySampler:
+    """
+    Validates the first `n` items of every array.
+    """
+    if n < 1:
+        raise ValueError("n must be a positive integer")
+
+    def sampler(length: int) -> Sequence[int]:
+        return range(min(n, length))
+
+    return sampler
+
+
+def first_last_random(k: int, seed: int = 0) -> ArraySampler:
+    """
+    Validates the first and last items of every array, and `k` items in between, picked at random.
+
+    The same seed always picks the same items for arrays of the same length, so failures are reproducible.
+    """
+    if k < 0:
+        raise ValueError("k must be zero or a positive integer")
+
+    def sampler(length: int) -> Sequence[int]:
+        if length <= k + 2:
+            return range(length)
+        middle = random.Random(seed).sample(range(1, length - 1), k)
+        return [0, *sorted(middle), length - 1]
+
+    return sampler
+
+
+def stride(step: int) -> ArraySampler:
+    """
+    Validates every `step`th item of every array, starting with the first.
+    """
+    if step < 1:
+        raise ValueError("step must be a positive integer")
+
+    def sampler(length: int) -> Sequence[int]:
+        return range(0, length, step)
+
+    return sampler
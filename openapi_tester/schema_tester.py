@@ -1,5 +1,6 @@
 import re
-from typing import Any, Callable, Dict, KeysView, List, Optional, Union, cast
+import time
+from typing import Any, Callable, Dict, FrozenSet, Iterable, KeysView, List, Optional, Tuple, Union, cast
 
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
@@ -8,9 +9,30 @@ from rest_framework.response import Response
 from rest_framework.test import APITestCase
 
 from openapi_tester import type_declarations as td
+from openapi_tester.compiler import SchemaCompiler, SchemaNode, Validator, expand_references, handle_all_of
 from openapi_tester.constants import OPENAPI_PYTHON_MAPPING
-from openapi_tester.exceptions import DocumentationError, OpenAPISchemaError, UndocumentedSchemaSectionError
+from openapi_tester.coverage import HTTP_METHODS, EndpointCoverage
+from openapi_tester.exceptions import (
+    CaseError,
+    DocumentationError,
+    DocumentationErrors,
+    OpenAPISchemaError,
+    UndocumentedSchemaSectionError,
+)
 from openapi_tester.loaders import DrfSpectacularSchemaLoader, DrfYasgSchemaLoader, StaticSchemaLoader
+from openapi_tester.sampling import ArraySampler
+from openapi_tester.stats import ValidationStats
+
+# a path through the tested data is a linked list of (parent path, kind, value) segments, where the value is the
+# reference for the root, and the key or index for the other kinds
+ReferencePath = Optional[Tuple[Any, int, Any]]
+_ROOT, _KEY, _ITEM, _INDEX = 0, 1, 2, 3
+
+
+class _BranchMismatch(AssertionError):
+    """
+    Raised internally when data does not match a schema option that is being probed.
+    """
 
 
 class SchemaTester:
@@ -19,6 +41,12 @@ class SchemaTester:
         case_tester: Optional[Callable[[str], None]] = None,
         ignore_case: Optional[List[str]] = None,
         schema_file_path: Optional[str] = None,
+        schema_cache_dir: Optional[str] = None,
+        preserve_references: bool = False,
+        array_sampling: Optional[ArraySampler] = None,
+        stats: Optional[ValidationStats] = None,
+        watch_schema: bool = False,
+        schema_validation: str = "always",
     ) -> None:
         """
         Iterates through an OpenAPI schema object and API response to check that they match at every level.
@@ -26,63 +54,209 @@ class SchemaTester:
         :param case_tester: An optional callable that validates schema and response keys
         :param ignore_case: An optional list of keys for the case_tester to ignore
         :schema_file_path: The file path to an OpenAPI yaml or json file. Only passed when using a static schema loader
+        :schema_cache_dir: An optional directory for caching processed schemas between test runs
+        :preserve_references: Resolve schema references as they are used, instead of inlining them when loading
+        :array_sampling: An optional sampling policy from openapi_tester.sampling, to only validate some array items
+        :stats: An optional recorder for the time spent in each phase of validation, defaults to ValidationStats
+        :watch_schema: Reload the schema file when it changes. Only used with a static schema loader
+        :schema_validation: When to validate the schema against the OpenAPI specification: "always", "once" per
+            version of the schema, in the "background", or "never"
         :raises: openapi_tester.exceptions.DocumentationError or ImproperlyConfigured
         """
         self.case_tester = case_tester
         self.ignore_case = ignore_case or []
+        self.array_sampling = array_sampling
+        self.stats = stats if stats is not None else ValidationStats()
+        # time spent on case checks and error messages during the current traversal, recorded once it completes
+        self._case_check_time = 0.0
+        self._format_error_time = 0.0
 
         self.loader: Union[StaticSchemaLoader, DrfSpectacularSchemaLoader, DrfYasgSchemaLoader]
+        options: Dict[str, Any] = {
+            "cache_dir": schema_cache_dir,
+            "preserve_references": preserve_references,
+            "validation": schema_validation,
+        }
         if schema_file_path is not None:
-            self.loader = StaticSchemaLoader(schema_file_path)
+            self.loader = StaticSchemaLoader(schema_file_path, watch=watch_schema, **options)
         elif "drf_spectacular" in settings.INSTALLED_APPS:
-            self.loader = DrfSpectacularSchemaLoader()
+            self.loader = DrfSpectacularSchemaLoader(**options)
         elif "drf_yasg" in settings.INSTALLED_APPS:
-            self.loader = DrfYasgSchemaLoader()
+            self.loader = DrfYasgSchemaLoader(**options)
         else:
             raise ImproperlyConfigured("No loader is configured.")
 
+        # compiled response schema sections, keyed by (path, method, status code), for the schema they were built from
+        self._compiled_schema: Optional[dict] = None
+        self._compiled_sections: Dict[Tuple[str, str, str], SchemaNode] = {}
+        self._compiler = self._create_compiler()
+        # responses validated per (path, method, status code)
+        self.coverage = EndpointCoverage()
+
     @staticmethod
     def handle_all_of(**kwargs: dict) -> dict:
-        properties: Dict[str, Any] = {}
-        for entry in kwargs.pop("allOf"):
-            for key, value in entry["properties"].items():
-                if key in properties and isinstance(value, dict):
-                    properties[key] = {**properties[key], **value}
-                elif key in properties and isinstance(value, list):
-                    properties[key] = [*properties[key], *value]
-                else:
-                    properties[key] = value
-        return {**kwargs, "type": "object", "properties": properties}
+        return handle_all_of(**kwargs)
 
     def handle_one_of(
         self,
-        schema_section: dict,
+        schema_node: SchemaNode,
         data: Any,
-        reference: str,
+        path: ReferencePath,
         case_tester: Optional[Callable[[str], None]] = None,
         ignore_case: Optional[List[str]] = None,
+        probe: bool = False,
+        array_sampling: Optional[ArraySampler] = None,
+        errors: Optional[List[DocumentationError]] = None,
     ):
         matches = 0
-        for option in schema_section["oneOf"]:
+        for option in schema_node.one_of or []:
+            if not self._may_match(option, data):
+                continue
             try:
-                self.test_schema_section(
-                    schema_section=option,
+                self._walk(
+                    schema_node=option,
                     data=data,
-                    reference=reference,
+                    path=path,
                     case_tester=case_tester,
                     ignore_case=ignore_case,
+                    probe=True,
+                    array_sampling=array_sampling,
                 )
                 matches += 1
-            except DocumentationError:
+            except _BranchMismatch:
                 continue
+            if matches == 2:
+                # the data can't match only one option anymore, so the remaining options don't need to be tried
+                break
         if matches != 1:
-            raise DocumentationError(
-                message=f"expected data to match one and only one of schema types, received {matches} matches.",
+            received = "0 matches" if matches == 0 else "at least 2 matches"
+            self._mismatch(
+                errors,
+                probe,
+                path,
+                message=f"expected data to match one and only one of schema types, received {received}.",
                 response=data,
-                schema=schema_section,
-                reference=reference,
+                schema=schema_node.schema,
             )
 
+    def handle_any_of(
+        self,
+        schema_node: SchemaNode,
+        data: Any,
+        path: ReferencePath,
+        case_tester: Optional[Callable[[str], None]] = None,
+        ignore_case: Optional[List[str]] = None,
+        probe: bool = False,
+        array_sampling: Optional[ArraySampler] = None,
+        errors: Optional[List[DocumentationError]] = None,
+    ):
+        for option in schema_node.any_of or []:
+            if not self._may_match(option, data):
+                continue
+            try:
+                self._walk(
+                    schema_node=option,
+                    data=data,
+                    path=path,
+                    case_tester=case_tester,
+                    ignore_case=ignore_case,
+                    probe=True,
+                    array_sampling=array_sampling,
+                )
+                return
+            except _BranchMismatch:
+                continue
+        self._mismatch(
+            errors,
+            probe,
+            path,
+            message="expected data to match one or more of schema types, received 0 matches.",
+            response=data,
+            schema=schema_node.schema,
+        )
+
+    def _may_match(self, schema_node: SchemaNode, data: Any) -> bool:
+        """
+        Cheaply checks whether data could match a oneOf or anyOf option, before it's validated against the option.
+
+        Only the type of the data, and the keys of objects, are checked, so options that obviously don't match are
+        skipped without walking the data.
+        """
+        if not schema_node.type or schema_node.one_of is not None or schema_node.any_of is not None:
+            return True
+        if isinstance(self._validate_openapi_type(schema_node.schema, data), str):
+            return False
+        if schema_node.type == "object" and isinstance(data, dict):
+            keys = data.keys()
+            if not schema_node.required_keys <= keys:
+                return False
+            if schema_node.additional_properties is None and not keys <= schema_node.property_keys:
+                return False
+        return True
+
+    @staticmethod
+    def get_discriminated_option(schema_node: SchemaNode, data: Any) -> Optional[SchemaNode]:
+        """
+        Returns the oneOf or anyOf option that the data selects with its discriminator property, if there is one.
+        """
+        if schema_node.discriminator is None or not isinstance(data, dict):
+            return None
+        property_name, mapping = schema_node.discriminator
+        value = data.get(property_name)
+        return mapping.get(value) if isinstance(value, str) else None
+
+    @staticmethod
+    def _join_reference(path: ReferencePath) -> str:
+        """
+        Builds the reference string for a path through the tested data.
+        """
+        segments = []
+        while path is not None:
+            path, kind, value = path
+            if kind == _ROOT:
+                segments.append(value)
+            elif kind == _KEY:
+                segments.append(f".dict:key:{value}")
+            elif kind == _INDEX:
+                segments.append(f".list:index:{value}")
+            else:
+                segments.append(".list")
+        return "".join(reversed(segments))
+
+    @staticmethod
+    def _join_pointer(path: ReferencePath) -> str:
+        """
+        Builds the JSON pointer to the value at the end of a path through the tested data.
+        """
+        segments = []
+        while path is not None:
+            path, kind, value = path
+            if kind != _ROOT:
+                segments.append(f"/{str(value).replace('~', '~0').replace('/', '~1')}")
+        return "".join(reversed(segments))
+
+    def _mismatch(
+        self, errors: Optional[List[DocumentationError]], probe: bool, path: ReferencePath, **kwargs: Any
+    ) -> None:
+        """
+        Raises the error for a mismatch between the schema and the tested data, or records it if errors are collected.
+
+        Errors raised while probing oneOf options are discarded, so a cheap sentinel is used in place of a
+        documentation error.
+        """
+        if probe:
+            raise _BranchMismatch()
+        start = time.perf_counter()
+        kwargs["reference"] = self._join_reference(path)
+        kwargs["pointer"] = self._join_pointer(path)
+        if self.loader.preserve_references:
+            kwargs["schema"] = expand_references(kwargs["schema"], self.loader.resolve_reference)
+        error = DocumentationError(**kwargs)
+        self._format_error_time += time.perf_counter() - start
+        if errors is None:
+            raise error
+        errors.append(error)
+
     @staticmethod
     def _get_key_value(schema: dict, key: str, error_addon: str = "") -> dict:
         """
@@ -124,32 +298,49 @@ class SchemaTester:
     def _responses_error_text_addon(status_code: Union[int, str], response_status_codes: KeysView) -> str:
         return f'\n\nUndocumented status code: {status_code}.\n\nDocumented responses include: {", ".join([str(key) for key in response_status_codes])}. '
 
-    def get_response_schema_section(self, response: td.Response) -> dict:
+    def get_response_operation(self, response: td.Response) -> Tuple[str, str, str]:
         """
-        Indexes schema by url, HTTP method, and status code to get the schema section related to a specific response.
+        Returns the schema path, HTTP method, and status code that document a response.
 
         :param response: DRF Response Instance
-        :return Response schema
+        :return (parameterized path, method, status code)
         """
-        path = response.request["PATH_INFO"]
-        method = response.request["REQUEST_METHOD"]
-        status_code = str(response.status_code)
-        schema = self.loader.get_schema()
-        parameterized_path = self.loader.parameterize_path(path)
+        return self.get_operation(
+            response.request["PATH_INFO"], response.request["REQUEST_METHOD"], response.status_code
+        )
+
+    def get_operation(self, path: str, method: str, status_code: Union[int, str]) -> Tuple[str, str, str]:
+        """
+        Returns the schema path, HTTP method, and status code that document a response to a request.
+
+        :param path: The requested path, e.g., /api/v1/cars/1
+        :return (parameterized path, method, status code)
+        """
+        return self.loader.parameterize_path(path), method.lower(), str(status_code)
+
+    def get_schema_section(self, schema: dict, parameterized_path: str, method: str, status_code: str) -> dict:
+        """
+        Indexes schema by url, HTTP method, and status code to get the schema section related to a specific response.
+        """
+        resolve = self.loader.resolve_reference if self.loader.preserve_references else lambda section: section
         paths_object = self._get_key_value(schema=schema, key="paths")
-        route_object = self._get_key_value(
-            schema=paths_object,
-            key=parameterized_path,
-            error_addon=self._route_error_text_addon(paths_object.keys()),
+        route_object = resolve(
+            self._get_key_value(
+                schema=paths_object,
+                key=parameterized_path,
+                error_addon=self._route_error_text_addon(paths_object.keys()),
+            )
         )
         method_object = self._get_key_value(
-            schema=route_object, key=method.lower(), error_addon=self._method_error_text_addon(route_object.keys())
+            schema=route_object, key=method, error_addon=self._method_error_text_addon(route_object.keys())
         )
         responses_object = self._get_key_value(schema=method_object, key="responses")
-        status_code_object = self._get_status_code(
-            schema=responses_object,
-            status_code=status_code,
-            error_addon=self._responses_error_text_addon(status_code, responses_object.keys()),
+        status_code_object = resolve(
+            self._get_status_code(
+                schema=responses_object,
+                status_code=status_code,
+                error_addon=self._responses_error_text_addon(status_code, responses_object.keys()),
+            )
         )
         if "openapi" not in schema:
             # openapi 2.0, i.e. "swagger" has a different structure than openapi 3.0 status sub-schemas
@@ -158,6 +349,41 @@ class SchemaTester:
         json_object = self._get_key_value(schema=content_object, key="application/json")
         return self._get_key_value(schema=json_object, key="schema")
 
+    def get_response_schema_section(self, response: td.Response) -> dict:
+        """
+        Indexes schema by url, HTTP method, and status code to get the schema section related to a specific response.
+
+        :param response: DRF Response Instance
+        :return Response schema
+        """
+        schema = self.loader.get_schema()
+        return self.get_schema_section(schema, *self.get_response_operation(response))
+
+    def get_compiled_schema_section(self, response: td.Response) -> SchemaNode:
+        """
+        Returns the compiled schema section related to a specific response.
+
+        Sections are compiled the first time an operation is validated, and reused until a new schema is loaded.
+        """
+        return self._get_compiled_operation_section(self.get_response_operation(response))
+
+    def _get_compiled_operation_section(self, operation: Tuple[str, str, str]) -> SchemaNode:
+        schema = self.loader.get_schema()
+        if schema is not self._compiled_schema:
+            # when a watched schema is reloaded, only the sections of paths that changed are compiled again
+            changed_paths = self.loader.get_changed_paths(self._compiled_schema)
+            self._compiled_sections = {
+                key: section
+                for key, section in self._compiled_sections.items()
+                if changed_paths is not None and key[0] not in changed_paths
+            }
+            self._compiled_schema = schema
+            self._compiler = self._create_compiler()
+        if operation not in self._compiled_sections:
+            schema_section = self.get_schema_section(schema, *operation)
+            self._compiled_sections[operation] = self._compiler.compile(schema_section)
+        return self._compiled_sections[operation]
+
     @staticmethod
     def is_nullable(schema_item: dict) -> bool:
         """
@@ -176,13 +402,111 @@ class SchemaTester:
             for nullable_key in [openapi_schema_3_nullable, swagger_2_nullable]
         )
 
-    def _validate_key_casing(
-        self, key: str, case_tester: Optional[Callable[[str], None]] = None, ignore_case: Optional[List[str]] = None
-    ) -> None:
-        tester = case_tester or getattr(self, "case_tester", None)
-        ignore_case = [*self.ignore_case, *(ignore_case or [])]
-        if tester and key not in ignore_case:
-            tester(key)
+    @staticmethod
+    def get_miscased_keys(keys: Iterable[str], case_tester: Callable[[str], None]) -> FrozenSet[str]:
+        """
+        Returns the keys that a case tester rejects.
+        """
+        miscased_keys = set()
+        for key in keys:
+            try:
+                case_tester(key)
+            except CaseError:
+                miscased_keys.add(key)
+        return frozenset(miscased_keys)
+
+    def audit_key_casing(
+        self, case_tester: Optional[Callable[[str], None]] = None, ignore_case: Optional[List[str]] = None
+    ) -> Dict[str, List[str]]:
+        """
+        Tests the casing of every property declared in the schema, without validating any responses.
+
+        Components are audited by themselves, and schemas declared in responses are audited without the components
+        inlined into them, so each miscased key is only reported where it's declared.
+
+        :param case_tester: Optional Callable that checks a string's casing, defaults to the tester's case tester
+        :param ignore_case: List of strings to ignore, on top of the tester's ignore_case list
+        :return: The sorted miscased keys, per JSON pointer of the component or response schema they're declared in
+        """
+        tester = case_tester or self.case_tester
+        if tester is None:
+            return {}
+        ignored = {*self.ignore_case, *(ignore_case or [])}
+        schema = self.loader.get_schema()
+        resolve = self.loader.resolve_reference if self.loader.preserve_references else lambda section: section
+        components, responses = self._get_audit_sections(schema, resolve)
+        # schemas inlined from components when the schema was de-referenced are equal to the components. Components
+        # are grouped by their keys, so schemas are only compared to the components they might be equal to
+        inlined: Dict[Tuple[Tuple[str, ...], Tuple[str, ...]], List[dict]] = {}
+        for _, component in components:
+            if isinstance(component, dict):
+                inlined.setdefault(self._get_section_keys(component), []).append(component)
+
+        report: Dict[str, List[str]] = {}
+        for pointer, section in components + responses:
+            keys = set()
+            stack = [section]
+            while stack:
+                node = stack.pop()
+                if not isinstance(node, dict) or "$ref" in node:
+                    continue
+                if node is not section and node in inlined.get(self._get_section_keys(node), ()):
+                    continue
+                properties = node.get("properties")
+                if isinstance(properties, dict):
+                    keys.update(properties)
+                    stack.extend(properties.values())
+                for key in ["items", "additionalProperties", "not"]:
+                    stack.append(node.get(key))
+                for key in ["allOf", "oneOf", "anyOf"]:
+                    stack.extend(node.get(key) or [])
+            miscased_keys = self.get_miscased_keys(keys - ignored, tester)
+            if miscased_keys:
+                report[pointer] = sorted(miscased_keys)
+        return report
+
+    @staticmethod
+    def _get_audit_sections(
+        schema: dict, resolve: Callable[[dict], dict]
+    ) -> Tuple[List[Tuple[str, Any]], List[Tuple[str, Any]]]:
+        """
+        Returns the component schemas, and the schemas declared in responses, with their JSON pointers.
+        """
+
+        def escape(key: str) -> str:
+            return str(key).replace("~", "~0").replace("/", "~1")
+
+        components: List[Tuple[str, Any]] = []
+        for pointer, section in [
+            ("#/definitions", schema.get("definitions", {})),
+            ("#/components/schemas", schema.get("components", {}).get("schemas", {})),
+        ]:
+            components += [(f"{pointer}/{escape(name)}", component) for name, component in section.items()]
+        responses: List[Tuple[str, Any]] = []
+        for path, path_object in schema["paths"].items():
+            for method, method_object in resolve(path_object).items():
+                if method.lower() not in HTTP_METHODS:
+                    continue
+                for status_code, response in method_object.get("responses", {}).items():
+                    pointer = f"#/paths/{escape(path)}/{method}/responses/{status_code}"
+                    response = resolve(response)
+                    if "schema" in response:
+                        responses.append((f"{pointer}/schema", response["schema"]))
+                    for content_type, media_type in response.get("content", {}).items():
+                        if "schema" in media_type:
+                            responses.append((f"{pointer}/content/{escape(content_type)}/schema", media_type["schema"]))
+        return components, responses
+
+    @staticmethod
+    def _get_section_keys(section: dict) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """
+        Returns the keys of a schema section, and of its properties. Equal sections have equal keys.
+        """
+        properties = section.get("properties")
+        return (
+            tuple(sorted(map(str, section))),
+            tuple(sorted(map(str, properties))) if isinstance(properties, dict) else (),
+        )
 
     @staticmethod
     def _validate_enum(schema_section: dict, data: str) -> Union[Optional[str], bool]:
@@ -196,15 +520,20 @@ class SchemaTester:
             )
 
     @staticmethod
-    def _validate_pattern(schema_section: dict, data: str) -> Union[Optional[str], bool]:
-        if "pattern" not in schema_section:
-            return False
+    def _create_pattern_validator(pattern: str) -> Validator:
+        """
+        Returns a validator for a `pattern`, compiled once, rather than once per validated value.
+        """
         try:
-            compiled_pattern = re.compile(schema_section["pattern"])
+            compiled_pattern = re.compile(pattern)
         except re.error as e:
-            raise OpenAPISchemaError(f"String pattern is not valid regex: {schema_section['pattern']}") from e
-        if not compiled_pattern.match(data):
-            return f"String '{data}' does not validate using the specified pattern: {schema_section['pattern']}"
+            raise OpenAPISchemaError(f"String pattern is not valid regex: {pattern}") from e
+
+        def validate_pattern(schema_section: dict, data: str) -> Union[Optional[str], bool]:
+            if not compiled_pattern.match(data):
+                return f"String '{data}' does not validate using the specified pattern: {pattern}"
+
+        return validate_pattern
 
     @staticmethod
     def _validate_format(schema_section: dict, data: str) -> Union[Optional[str], bool]:
@@ -253,6 +582,29 @@ class SchemaTester:
                 f"but received {type(data).__name__}."
             )
 
+    def _get_validators(self, schema_section: dict) -> List[Validator]:
+        """
+        Returns the validators that apply to a schema section, in the order they should run.
+        """
+        validators: List[Validator] = [self._validate_openapi_type]
+        if schema_section.get("format"):
+            validators.append(self._validate_format)
+        if "pattern" in schema_section:
+            validators.append(self._create_pattern_validator(schema_section["pattern"]))
+        if "enum" in schema_section:
+            validators.append(self._validate_enum)
+        return validators
+
+    def compile_schema_section(self, schema_section: dict) -> SchemaNode:
+        """
+        Compiles a schema section into a tree of schema nodes, ready to be validated against.
+        """
+        return self._create_compiler().compile(schema_section)
+
+    def _create_compiler(self) -> SchemaCompiler:
+        resolve_reference = self.loader.resolve_reference if self.loader.preserve_references else None
+        return SchemaCompiler(self._get_validators, resolve_reference, lookup_reference=self.loader.resolve_reference)
+
     def test_schema_section(
         self,
         schema_section: dict,
@@ -260,148 +612,243 @@ class SchemaTester:
         reference: str = "",
         case_tester: Optional[Callable[[str], None]] = None,
         ignore_case: Optional[List[str]] = None,
+        array_sampling: Optional[ArraySampler] = None,
+        collect_errors: bool = False,
     ) -> None:
         """
         This method orchestrates the testing of a schema section
         """
-        if "oneOf" in schema_section and data is not None:
-            self.handle_one_of(
-                schema_section=schema_section,
+        self._test_schema_node(
+            schema_node=self.compile_schema_section(schema_section),
+            data=data,
+            reference=reference,
+            case_tester=case_tester,
+            ignore_case=ignore_case,
+            array_sampling=array_sampling,
+            collect_errors=collect_errors,
+        )
+
+    def _test_schema_node(
+        self,
+        schema_node: SchemaNode,
+        data: Any,
+        reference: str,
+        case_tester: Optional[Callable[[str], None]],
+        ignore_case: Optional[List[str]],
+        array_sampling: Optional[ArraySampler] = None,
+        collect_errors: bool = False,
+    ) -> None:
+        errors: Optional[List[DocumentationError]] = [] if collect_errors else None
+        self._walk(
+            schema_node=schema_node,
+            data=data,
+            path=(None, _ROOT, reference),
+            case_tester=case_tester,
+            ignore_case=ignore_case,
+            array_sampling=array_sampling or self.array_sampling,
+            errors=errors,
+        )
+        if errors:
+            raise DocumentationErrors(errors)
+
+    def _walk(
+        self,
+        schema_node: SchemaNode,
+        data: Any,
+        path: ReferencePath,
+        case_tester: Optional[Callable[[str], None]],
+        ignore_case: Optional[List[str]],
+        probe: bool = False,
+        array_sampling: Optional[ArraySampler] = None,
+        errors: Optional[List[DocumentationError]] = None,
+    ) -> None:
+        """
+        Validates data against a compiled schema section.
+
+        Nested data is handled through an explicit stack of work items rather than recursion, so deeply nested data
+        can't exceed the recursion limit. Items are processed depth first, in the same order as a recursive walk.
+        """
+        stack: List[tuple] = [(schema_node, data, path)]
+        while stack:
+            schema_node, data, path = stack.pop()
+            self._test_node(schema_node, data, path, stack, case_tester, ignore_case, probe, array_sampling, errors)
+
+    def _test_node(
+        self,
+        schema_node: SchemaNode,
+        data: Any,
+        path: ReferencePath,
+        stack: List[tuple],
+        case_tester: Optional[Callable[[str], None]],
+        ignore_case: Optional[List[str]],
+        probe: bool,
+        array_sampling: Optional[ArraySampler],
+        errors: Optional[List[DocumentationError]],
+    ) -> None:
+        if (schema_node.one_of is not None or schema_node.any_of is not None) and data is not None:
+            option = self.get_discriminated_option(schema_node, data)
+            if option is not None:
+                # the discriminator selects a single option, so there is no need to try the others
+                stack.append((option, data, path))
+                return
+            for handler, options in [
+                (self.handle_one_of, schema_node.one_of),
+                (self.handle_any_of, schema_node.any_of),
+            ]:
+                if options is not None:
+                    handler(
+                        schema_node=schema_node,
+                        data=data,
+                        path=path,
+                        case_tester=case_tester,
+                        ignore_case=ignore_case,
+                        probe=probe,
+                        array_sampling=array_sampling,
+                        errors=errors,
+                    )
+            return
+        if not schema_node.type:
+            # No schema type == any schema type, so we return early
+            return
+
+        for validator in schema_node.validators:
+            error = validator(schema_node.schema, data)
+            if isinstance(error, str):
+                self._mismatch(errors, probe, path, message=error, response=data, schema=schema_node.schema)
+                return
+
+        if schema_node.type == "object":
+            self._test_openapi_type_object(
+                schema_node=schema_node,
                 data=data,
-                reference=reference,
+                path=path,
+                stack=stack,
                 case_tester=case_tester,
                 ignore_case=ignore_case,
+                probe=probe,
+                errors=errors,
+            )
+        elif schema_node.type == "array":
+            self._test_openapi_type_array(
+                schema_node=schema_node,
+                data=data,
+                path=path,
+                stack=stack,
+                probe=probe,
+                array_sampling=array_sampling,
+                errors=errors,
             )
-        else:
-            if "allOf" in schema_section:
-                merged_schema = self.handle_all_of(**schema_section)
-                schema_section = merged_schema
-            schema_section_type = schema_section.get("type")
-            if not schema_section_type and "properties" in schema_section:
-                schema_section_type = "object"
-            if not schema_section_type:
-                # No schema type == any schema type, so we return early
-                return
-
-            validators = [
-                self._validate_openapi_type,
-                self._validate_format,
-                self._validate_pattern,
-                self._validate_enum,
-            ]
-            for validator in validators:
-                error = validator(schema_section, data)
-                if isinstance(error, str):
-                    raise DocumentationError(message=error, response=data, schema=schema_section, reference=reference)
-
-            if schema_section_type == "object":
-                self._test_openapi_type_object(
-                    schema_section=schema_section,
-                    data=data,
-                    reference=reference,
-                    case_tester=case_tester,
-                    ignore_case=ignore_case,
-                )
-            elif schema_section_type == "array":
-                self._test_openapi_type_array(
-                    schema_section=schema_section,
-                    data=data,
-                    reference=reference,
-                    case_tester=case_tester,
-                    ignore_case=ignore_case,
-                )
 
     def _test_openapi_type_object(
         self,
-        schema_section: dict,
+        schema_node: SchemaNode,
         data: dict,
-        reference: str,
+        path: ReferencePath,
+        stack: List[tuple],
         case_tester: Optional[Callable[[str], None]],
         ignore_case: Optional[List[str]],
+        probe: bool,
+        errors: Optional[List[DocumentationError]] = None,
     ) -> None:
-        if "properties" in schema_section:
-            properties = schema_section["properties"]
-        elif "additionalProperties" in schema_section:
-            properties = {"": schema_section["additionalProperties"]}
-        else:
-            properties = {}
-        required_keys = schema_section["required"] if "required" in schema_section else list(properties.keys())
         response_keys = data.keys()
-
-        if len([key for key in response_keys if key in required_keys]) != len(required_keys):
-            missing_keys = ", ".join(str(key) for key in sorted(list(set(required_keys) - set(response_keys))))
-            hint = "Remove the key(s) from your OpenAPI docs, or include it in your API response."
-            message = f"The following properties are missing from the tested data: {missing_keys}."
-            raise DocumentationError(
-                message=message,
-                response=data,
-                schema=schema_section,
-                reference=reference,
-                hint=hint,
-            )
-
-        for schema_key, response_key in zip([key for key in properties.keys() if key in response_keys], response_keys):
-            self._validate_key_casing(schema_key, case_tester, ignore_case)
-            self._validate_key_casing(response_key, case_tester, ignore_case)
-            if schema_key in required_keys and schema_key not in response_keys:
-                raise DocumentationError(
-                    message=f"Schema key `{schema_key}` was not found in the tested data.",
-                    response=data,
-                    schema=schema_section,
-                    reference=reference,
-                    hint="The response should contain this key or the documentation should change.",
+        missing_keys = schema_node.required_keys - response_keys
+        if schema_node.additional_properties is None:
+            excess_keys = response_keys - schema_node.property_keys
+        else:
+            excess_keys = set()
+
+        if missing_keys or excess_keys:
+            messages, hints = [], []
+            if missing_keys:
+                messages.append(
+                    "The following properties are missing from the tested data: "
+                    f"{', '.join(sorted(str(key) for key in missing_keys))}."
                 )
-            if response_key not in properties:
-                raise DocumentationError(
-                    message=f"Key `{response_key}` not found in the OpenAPI schema.",
-                    response=data,
-                    schema=schema_section,
-                    reference=reference,
-                    hint="The response should contain this key or the documentation should change.",
+                hints.append("Remove the key(s) from your OpenAPI docs, or include it in your API response.")
+            if excess_keys:
+                messages.append(
+                    "The following properties are not documented in the OpenAPI schema: "
+                    f"{', '.join(sorted(str(key) for key in excess_keys))}."
                 )
-
-            schema_value = properties[schema_key]
-            response_value = data[schema_key]
-            self.test_schema_section(
-                schema_section=schema_value,
-                data=response_value,
-                reference=f"{reference}.dict:key:{schema_key}",
-                case_tester=case_tester,
-                ignore_case=ignore_case,
+                hints.append("Remove the key(s) from your API response, or include it in your OpenAPI docs.")
+            self._mismatch(
+                errors,
+                probe,
+                path,
+                message=" ".join(messages),
+                response=data,
+                schema=schema_node.schema,
+                hint=" ".join(hints),
             )
 
+        tester = case_tester or self.case_tester
+        if tester:
+            start = time.perf_counter()
+            property_keys = schema_node.property_keys
+            miscased_keys = schema_node.miscased_keys.get(tester)
+            if miscased_keys is None:
+                miscased_keys = schema_node.miscased_keys[tester] = self.get_miscased_keys(property_keys, tester)
+            # declared keys are tested once per schema node, so only undeclared keys are tested for every response
+            if miscased_keys or not response_keys <= property_keys:
+                ignored = {*self.ignore_case, *(ignore_case or [])}
+                for key in response_keys:
+                    if (key in miscased_keys or key not in property_keys) and key not in ignored:
+                        try:
+                            tester(key)
+                        except CaseError as error:
+                            if errors is None:
+                                raise
+                            self._mismatch(
+                                errors, probe, path, message=str(error), response=data, schema=schema_node.schema
+                            )
+            self._case_check_time += time.perf_counter() - start
+
+        properties = schema_node.properties
+        additional_properties = schema_node.additional_properties
+        # values are pushed in reverse, so they're tested in the order they appear in the response
+        for key in reversed(list(response_keys)):
+            if key in properties:
+                stack.append((properties[key], data[key], (path, _KEY, key)))
+            elif isinstance(additional_properties, SchemaNode):
+                stack.append((additional_properties, data[key], (path, _KEY, key)))
+
     def _test_openapi_type_array(
         self,
-        schema_section: dict,
-        data: dict,
-        reference: str,
-        case_tester: Optional[Callable[[str], None]],
-        ignore_case: Optional[List[str]],
+        schema_node: SchemaNode,
+        data: list,
+        path: ReferencePath,
+        stack: List[tuple],
+        probe: bool,
+        array_sampling: Optional[ArraySampler] = None,
+        errors: Optional[List[DocumentationError]] = None,
     ) -> None:
-        items = schema_section["items"]
+        items = schema_node.items
         if items is None and data is not None:
-            raise DocumentationError(
+            self._mismatch(
+                errors,
+                probe,
+                path,
                 message="Mismatched content. Response array contains data, when schema is empty.",
                 response=data,
-                schema=schema_section,
-                reference=reference,
+                schema=schema_node.schema,
                 hint="Document the contents of the empty dictionary to match the response object.",
             )
+            return
 
-        for datum in data:
-            self.test_schema_section(
-                schema_section=items,
-                data=datum,
-                reference=f"{reference}.list",
-                case_tester=case_tester,
-                ignore_case=ignore_case,
-            )
+        if array_sampling is None:
+            stack.extend([(items, data[index], (path, _ITEM, index)) for index in reversed(range(len(data)))])
+        else:
+            # sampled items are referenced by index, so a failure shows which of the items it was found in
+            indices = array_sampling(len(data))
+            stack.extend([(items, data[index], (path, _INDEX, index)) for index in reversed(indices)])
 
     def validate_response(
         self,
         response: td.Response,
         case_tester: Optional[Callable[[str], None]] = None,
         ignore_case: Optional[List[str]] = None,
+        array_sampling: Optional[ArraySampler] = None,
+        collect_errors: bool = False,
     ):
         """
         Verifies that an OpenAPI schema definition matches an API response.
@@ -409,22 +856,97 @@ class SchemaTester:
         :param response: The HTTP response
         :param case_tester: Optional Callable that checks a string's casing
         :param ignore_case: List of strings to ignore when testing the case of response keys
+        :param array_sampling: Optional sampling policy, overriding the one the schema tester was created with
+        :param collect_errors: Keep validating after the first inconsistency, and raise once with every inconsistency
         :raises: ``openapi_tester.exceptions.DocumentationError`` for inconsistencies in the API response and schema.
-                 ``openapi_tester.exceptions.CaseError`` for case errors.
+                 ``openapi_tester.exceptions.DocumentationErrors`` for all inconsistencies, if errors are collected.
+                 ``openapi_tester.exceptions.CaseError`` for case errors, unless errors are collected.
         """
 
         if not isinstance(response, Response):
             raise ValueError("expected response to be an instance of DRF Response")
 
-        response_schema = self.get_response_schema_section(response)
-        self.test_schema_section(
-            schema_section=response_schema,
-            data=response.json(),
-            reference="init",
+        self._validate(
+            response.request["PATH_INFO"],
+            response.request["REQUEST_METHOD"],
+            response.status_code,
+            response.json,
             case_tester=case_tester,
             ignore_case=ignore_case,
+            array_sampling=array_sampling,
+            collect_errors=collect_errors,
         )
 
+    def validate_data(
+        self,
+        path: str,
+        method: str,
+        status_code: Union[int, str],
+        data: Any,
+        case_tester: Optional[Callable[[str], None]] = None,
+        ignore_case: Optional[List[str]] = None,
+        array_sampling: Optional[ArraySampler] = None,
+        collect_errors: bool = False,
+    ) -> None:
+        """
+        Verifies that an OpenAPI schema definition matches decoded response data, for responses that weren't returned
+        by a test client, e.g., live or recorded traffic.
+
+        :param path: The requested path, e.g., /api/v1/cars/1
+        :param method: The HTTP method of the request
+        :param status_code: The status code of the response
+        :param data: The JSON decoded response body
+        :raises: The same errors as ``validate_response``.
+        """
+        self._validate(
+            path,
+            method,
+            status_code,
+            lambda: data,
+            case_tester=case_tester,
+            ignore_case=ignore_case,
+            array_sampling=array_sampling,
+            collect_errors=collect_errors,
+        )
+
+    def _validate(
+        self, path: str, method: str, status_code: Union[int, str], decode: Callable[[], Any], **kwargs: Any
+    ) -> None:
+        record = self.stats.record
+        if self.loader.schema is None:
+            start = time.perf_counter()
+            self.loader.get_schema()
+            record(None, "load_schema", time.perf_counter() - start)
+
+        start = time.perf_counter()
+        operation = self.get_operation(path, method, status_code)
+        resolved = time.perf_counter()
+        record(operation, "resolve_path", resolved - start)
+        self.coverage.record(operation)
+        schema_node = self._get_compiled_operation_section(operation)
+        looked_up = time.perf_counter()
+        record(operation, "lookup_schema", looked_up - resolved)
+        data = decode()
+        decoded = time.perf_counter()
+        record(operation, "decode_response", decoded - looked_up)
+
+        self._case_check_time = self._format_error_time = 0.0
+        try:
+            self._test_schema_node(schema_node=schema_node, data=data, reference="init", **kwargs)
+        finally:
+            record(operation, "validate", time.perf_counter() - decoded)
+            if self._case_check_time:
+                record(operation, "case_check", self._case_check_time)
+            if self._format_error_time:
+                record(operation, "format_error", self._format_error_time)
+
+    def get_coverage_report(self) -> Dict[str, Any]:
+        """
+        Returns a report of which documented responses have been validated by this schema tester, and how often.
+        """
+        resolve_reference = self.loader.resolve_reference if self.loader.preserve_references else None
+        return self.coverage.get_report(self.loader.get_schema(), resolve_reference)
+
     def test_case(self) -> APITestCase:
         validate_response = self.validate_response
 
@@ -432,10 +954,18 @@ class SchemaTester:
             response: td.Response,
             case_tester: Optional[Callable[[str], None]] = None,
             ignore_case: Optional[List[str]] = None,
+            array_sampling: Optional[ArraySampler] = None,
+            collect_errors: bool = False,
         ) -> None:
             """
             Assert response matches the OpenAPI spec.
             """
-            validate_response(response=response, case_tester=case_tester, ignore_case=ignore_case)
+            validate_response(
+                response=response,
+                case_tester=case_tester,
+                ignore_case=ignore_case,
+                array_sampling=array_sampling,
+                collect_errors=collect_errors,
+            )
 
         return cast(td.OpenAPITestCase, type("OpenAPITestCase", (APITestCase,), {"assertResponse": assert_response}))
@@ -0,0 +1,94 @@
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple
+
+MAGIC = b"OATSCHM1"
+HEADER_LENGTH = struct.Struct("<Q")
+
+
+class SharedPaths(Mapping):
+    """
+    Read-only mapping of schema paths, backed by a memory-mapped schema file.
+
+    Path items are only unpickled the first time they are accessed, so a process never holds more of the schema than
+    the operations it actually validates, and the file itself lives in the shared OS page cache.
+    """
+
+    def __init__(self, buffer: mmap.mmap, offset: int, index: Dict[str, Tuple[int, int]]) -> None:
+        self._buffer = buffer
+        self._offset = offset
+        self._index = index
+        self._items: Dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._items:
+            start, length = self._index[key]
+            start += self._offset
+            self._items[key] = pickle.loads(self._buffer[start : start + length])
+        return self._items[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+def export_schema(schema: dict, file_path: str, source: str = "", source_hash: str = "") -> None:
+    """
+    Writes a processed schema to a file that other processes can attach to with `attach_schema`.
+
+    :param schema: The de-referenced, validated and normalized schema
+    :param file_path: Where to write the schema file
+    :param source: Identifies where the schema came from, so processes only attach to the schema they expect
+    :param source_hash: A hash of the schema it was processed from, so processes don't attach to an outdated export
+    """
+    blobs = {key: pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL) for key, value in schema["paths"].items()}
+    index: Dict[str, Tuple[int, int]] = {}
+    position = 0
+    for key, blob in blobs.items():
+        index[key] = (position, len(blob))
+        position += len(blob)
+    header = pickle.dumps(
+        {"source": source, "source_hash": source_hash, "schema": {**schema, "paths": {}}, "index": index},
+        protocol=pickle.HIGHEST_PROTOCOL,
+    )
+    directory = os.path.dirname(os.path.abspath(file_path))
+    with tempfile.NamedTemporaryFile(dir=directory, suffix=".tmp", delete=False) as f:
+        f.write(MAGIC)
+        f.write(HEADER_LENGTH.pack(len(header)))
+        f.write(header)
+        for blob in blobs.values():
+            f.write(blob)
+    os.replace(f.name, file_path)
+
+
+def attach_schema(file_path: str, source: Optional[str] = None, source_hash: Optional[str] = None) -> Optional[dict]:
+    """
+    Attaches to a schema file written by `export_schema`.
+
+    :param file_path: The schema file
+    :param source: If passed, the schema is only returned if it was exported from the same source
+    :param source_hash: If passed, the schema is only returned if it was exported from a schema with the same hash
+    :return: The schema, with a read-only mapping of lazily loaded path items, or None if the source doesn't match
+    """
+    with open(file_path, "rb") as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if buffer[: len(MAGIC)] != MAGIC:
+        raise ValueError(f"`{file_path}` is not a shared schema file")
+    header_start = len(MAGIC) + HEADER_LENGTH.size
+    (header_length,) = HEADER_LENGTH.unpack(buffer[len(MAGIC) : header_start])
+    header = pickle.loads(buffer[header_start : header_start + header_length])
+    if (source is not None and header["source"] != source) or (
+        source_hash is not None and header.get("source_hash") != source_hash
+    ):
+        buffer.close()
+        return None
+    paths = SharedPaths(buffer, header_start + header_length, header["index"])
+    return {**header["schema"], "paths": paths}
@@ -0,0 +1,86 @@
+import json
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from openapi_tester.coverage import Operation
+
+# phases of a response validation, in the order they run. Case checks and error construction are part of traversal
+PHASES = ["load_schema", "resolve_path", "lookup_schema", "decode_response", "validate", "case_check", "format_error"]
+# phases that don't overlap, and add up to the time spent on an operation
+EXCLUSIVE_PHASES = ["resolve_path", "lookup_schema", "decode_response", "validate"]
+
+
+class ValidationStats:
+    """
+    Cumulative timings and counts of each phase of response validation, per operation.
+
+    Schema tester instrumentation can be replaced by passing any object with a compatible `record` method, e.g., a
+    subclass that forwards timings to a profiler or metrics backend.
+    """
+
+    def __init__(self) -> None:
+        # (operation, phase) -> [count, seconds]. Schema loading isn't tied to an operation, so it's recorded under None
+        self.timings: Dict[Tuple[Optional[Operation], str], List[float]] = {}
+
+    def record(self, operation: Optional[Operation], phase: str, seconds: float) -> None:
+        entry = self.timings.get((operation, phase))
+        if entry is None:
+            self.timings[(operation, phase)] = [1, seconds]
+        else:
+            entry[0] += 1
+            entry[1] += seconds
+
+    def clear(self) -> None:
+        self.timings.clear()
+
+    def get_timings(self) -> List[Tuple[Optional[Operation], str, int, float]]:
+        """
+        Returns the recorded timings as (operation, phase, count, seconds), e.g., to send them to another process.
+        """
+        return [(operation, phase, count, seconds) for (operation, phase), (count, seconds) in self.timings.items()]
+
+    def merge(self, timings: Iterable[Tuple[Optional[Operation], str, int, float]]) -> None:
+        """
+        Adds timings returned by `get_timings`, e.g., by another process.
+        """
+        for operation, phase, count, seconds in timings:
+            entry = self.timings.setdefault((tuple(operation) if operation else None, phase), [0, 0.0])  # type: ignore
+            entry[0] += count
+            entry[1] += seconds
+
+    def get_phases(self) -> Dict[str, Dict[str, float]]:
+        """
+        Returns the count and cumulative time of each phase, across all operations.
+        """
+        phases: Dict[str, Dict[str, float]] = {}
+        for (_, phase), (count, seconds) in self.timings.items():
+            totals = phases.setdefault(phase, {"count": 0, "seconds": 0.0})
+            totals["count"] += count
+            totals["seconds"] += seconds
+        return {phase: phases[phase] for phase in PHASES if phase in phases}
+
+    def get_operations(self) -> List[Dict[str, Any]]:
+        """
+        Returns the timings of each operation, with the operations that took the most time in total first.
+        """
+        operations: Dict[Operation, Dict[str, Dict[str, float]]] = {}
+        for (operation, phase), (count, seconds) in self.timings.items():
+            if operation is not None:
+                operations.setdefault(operation, {})[phase] = {"count": count, "seconds": seconds}
+        result = [
+            {
+                "path": path,
+                "method": method,
+                "status_code": status_code,
+                "seconds": sum(phases[phase]["seconds"] for phase in EXCLUSIVE_PHASES if phase in phases),
+                "phases": {phase: phases[phase] for phase in PHASES if phase in phases},
+            }
+            for (path, method, status_code), phases in operations.items()
+        ]
+        return sorted(result, key=lambda entry: entry["seconds"], reverse=True)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"phases": self.get_phases(), "operations": self.get_operations()}
+
+    def write_json(self, file_path: str) -> None:
+        with open(file_path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
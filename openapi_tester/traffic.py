@@ -0,0 +1,324 @@
+"""
+Offline validation of recorded traffic.
+
+Captures are streamed, so memory use doesn't grow with their size. Responses are validated in batches by a pool of
+worker processes, which attach to a schema exported once by the parent process, instead of each processing it again.
+"""
+import base64
+import json
+import os
+import re
+import tempfile
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import django
+
+from openapi_tester.configuration import get_case_tester, get_settings_options
+from openapi_tester.constants import SHARED_SCHEMA_ENV_VAR, SHARED_SCHEMA_HASH_ENV_VAR
+from openapi_tester.coverage import Operation
+from openapi_tester.schema_tester import SchemaTester
+
+# (path, method, status code, response body, as a JSON string or decoded)
+Record = Tuple[str, str, int, Any]
+# JSON-lines records are decoded by the workers, so the parent process only has to split lines. Entries that can't be
+# read are passed on as the error, to be counted as invalid records
+Item = Union[Record, str, ValueError]
+
+# strings, which are skipped as a whole, an unterminated string, or brackets
+JSON_BRACKETS_REGEX = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|"|[\[\]{}]')
+# the same, and colons, to tell keys from other strings
+JSON_TOKENS_REGEX = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|"|[\[\]{}:]')
+READ_SIZE = 1 << 20
+# HAR entries larger than this are skipped, so a malformed capture can't make the whole file be read into memory
+MAX_ENTRY_SIZE = 64 << 20
+# decoding errors this close to the end of the buffer may be caused by an entry that continues past it, e.g., `tru`
+TRUNCATION_MARGIN = 16
+# operations of responses whose path could not be resolved are grouped under this path
+UNRESOLVED_PATH = "<unresolved>"
+# records that could not be parsed are counted under this operation
+INVALID_RECORD: Operation = ("<invalid record>", "", "")
+
+# the schema tester of a worker process
+_tester: Optional[SchemaTester] = None
+
+
+def iter_jsonl(f: IO[str]) -> Iterator[Item]:
+    """
+    Yields the lines of a JSON-lines capture.
+
+    Each line is a JSON object with a `method`, a `path` or `url`, a `status_code` or `status`, and a `body`, which is
+    either the JSON response body or the response body as a string.
+    """
+    for line in f:
+        if line.strip():
+            yield line
+
+
+def parse_jsonl_record(line: str) -> Record:
+    entry = json.loads(line)
+    path = entry["path"] if "path" in entry else urlsplit(entry["url"]).path
+    body = entry["body"]
+    return path, entry["method"], int(entry.get("status_code", entry.get("status"))), body
+
+
+def iter_har(f: IO[str]) -> Iterator[Item]:
+    """
+    Yields the JSON responses of a HAR capture, decoding one entry at a time.
+    """
+    decoder = json.JSONDecoder()
+    buffer, position = find_har_entries(f)
+    if not buffer:
+        return
+
+    read_size = READ_SIZE
+    while True:
+        while position < len(buffer) and buffer[position] in " \t\r\n,":
+            position += 1
+        if position < len(buffer) and buffer[position] == "]":
+            return
+        try:
+            entry, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError as error:
+            truncated = error.pos >= len(buffer) - TRUNCATION_MARGIN or error.msg.startswith("Unterminated string")
+            if truncated and len(buffer) - position <= MAX_ENTRY_SIZE:
+                # the entry continues past the end of the buffer. The read size grows, so large entries aren't
+                # re-parsed from the start once per chunk
+                chunk = f.read(read_size)
+                if chunk:
+                    buffer = buffer[position:] + chunk
+                    position = 0
+                    read_size *= 2
+                    continue
+                if buffer[position:].strip():
+                    yield ValueError(f"Truncated HAR entry: {buffer[position : position + 200]}")
+                return
+            message = error.msg if not truncated else f"larger than {MAX_ENTRY_SIZE} characters"
+            yield ValueError(f"Malformed HAR entry ({message}): {buffer[position : position + 200]}")
+            buffer, position = skip_value(f, buffer, position)
+            read_size = READ_SIZE
+            continue
+        read_size = READ_SIZE
+        position = end
+        try:
+            record = parse_har_entry(entry)
+        except (ValueError, KeyError, TypeError, AttributeError) as error:
+            yield ValueError(f"Invalid HAR entry ({error!r}): {str(entry)[:200]}")
+            continue
+        if record is not None:
+            yield record
+
+
+def find_har_entries(f: IO[str]) -> Tuple[str, int]:
+    """
+    Finds the `log.entries` array of a HAR capture by following the keys of the JSON objects around it, so an
+    `"entries": [` inside a string or another object isn't mistaken for it. Values before the array are skipped
+    without decoding them.
+
+    :return: The buffer, and the position after the opening bracket of the array, or an empty buffer if there is none
+    """
+    buffer = ""
+    position = 0
+    # the keys of the open objects and arrays, None for the top-level value and for array items
+    keys: List[Optional[str]] = []
+    string: Optional[str] = None
+    key: Optional[str] = None
+    while True:
+        for match in JSON_TOKENS_REGEX.finditer(buffer, position):
+            token = match.group()
+            if token == '"':
+                # a string that continues past the end of the buffer
+                position = match.start()
+                break
+            if token == ":":
+                key = json.loads(string) if string is not None else None
+            elif token[0] == '"':
+                string = token
+            elif token in "[{":
+                if token == "[" and key == "entries" and keys == [None, "log"]:
+                    return buffer, match.end()
+                keys.append(key)
+                string = key = None
+            else:
+                if keys:
+                    keys.pop()
+                string = key = None
+        else:
+            position = len(buffer)
+        if len(buffer) - position > MAX_ENTRY_SIZE:
+            raise ValueError(f"The HAR file contains a string longer than {MAX_ENTRY_SIZE} characters")
+        chunk = f.read(READ_SIZE)
+        if not chunk:
+            return "", 0
+        buffer = buffer[position:] + chunk
+        position = 0
+
+
+def skip_value(f: IO[str], buffer: str, position: int) -> Tuple[str, int]:
+    """
+    Skips the JSON value at `position`, by matching brackets, without decoding it. Only unterminated strings are kept
+    in memory while reading ahead.
+
+    :return: The buffer, and the position after the value, or an empty buffer at the end of the file
+    """
+    depth = 0
+    while True:
+        for match in JSON_BRACKETS_REGEX.finditer(buffer, position):
+            token = match.group()
+            if token == '"':
+                # a string that continues past the end of the buffer
+                position = match.start()
+                break
+            if token in "[{":
+                depth += 1
+            elif token in "]}":
+                depth -= 1
+                if depth <= 0:
+                    return buffer, match.end()
+        else:
+            position = len(buffer)
+        if len(buffer) - position > MAX_ENTRY_SIZE:
+            raise ValueError(f"The HAR file contains a string longer than {MAX_ENTRY_SIZE} characters")
+        chunk = f.read(READ_SIZE)
+        if not chunk:
+            return "", 0
+        buffer = buffer[position:] + chunk
+        position = 0
+
+
+def parse_har_entry(entry: Dict[str, Any]) -> Optional[Record]:
+    """
+    Returns the record of a HAR entry with a JSON response body, or None for other responses.
+    """
+    response = entry["response"]
+    content = response.get("content", {})
+    text = content.get("text")
+    if text is None or "json" not in content.get("mimeType", ""):
+        return None
+    if content.get("encoding") == "base64":
+        text = base64.b64decode(text).decode()
+    return urlsplit(entry["request"]["url"]).path, entry["request"]["method"], int(response["status"]), text
+
+
+def iter_capture(file_path: str) -> Iterator[Item]:
+    """
+    Streams the responses of a HAR file, or a JSON-lines file, which is detected by its extension.
+    """
+    with open(file_path, encoding="utf-8") as f:
+        if file_path.endswith(".har"):
+            yield from iter_har(f)
+        else:
+            yield from iter_jsonl(f)
+
+
+def get_tester_options(options: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Returns schema tester arguments, from the OPENAPI_TESTER Django setting, overridden by `options`.
+
+    Options are passed to worker processes, so case testers are passed by name, and resolved here.
+    """
+    tester_options = get_settings_options()
+    tester_options.update({key: value for key, value in options.items() if value})
+    tester_options["case_tester"] = get_case_tester(tester_options["case_tester"])
+    return tester_options
+
+
+def init_worker(options: Dict[str, Any], shared_schema_path: str, source_hash: str) -> None:
+    global _tester
+    os.environ[SHARED_SCHEMA_ENV_VAR] = shared_schema_path
+    os.environ[SHARED_SCHEMA_HASH_ENV_VAR] = source_hash
+    django.setup()
+    _tester = SchemaTester(**get_tester_options(options))
+
+
+def validate_items(items: List[Item], tester: Optional[SchemaTester] = None) -> Dict[Operation, List[Any]]:
+    """
+    Validates a batch of responses.
+
+    :return: [validated, failed, first error message] per operation
+    """
+    tester = tester or _tester
+    results: Dict[Operation, List[Any]] = {}
+    for item in items:
+        try:
+            if isinstance(item, ValueError):
+                raise item
+            path, method, status_code, body = parse_jsonl_record(item) if isinstance(item, str) else item
+        except (ValueError, KeyError, TypeError) as error:
+            result = results.setdefault(INVALID_RECORD, [0, 0, None])
+            result[0] += 1
+            result[1] += 1
+            result[2] = result[2] or (str(error) if error is item else f"{error!r}: {str(item)[:200]}")
+            continue
+        try:
+            operation = tester.get_operation(path, method, status_code)  # type: ignore
+        except Exception:  # noqa: B902
+            operation = (UNRESOLVED_PATH, method.lower(), str(status_code))
+        result = results.setdefault(operation, [0, 0, None])
+        result[0] += 1
+        try:
+            data = json.loads(body) if isinstance(body, str) else body
+            tester.validate_data(path, method, status_code, data)  # type: ignore
+        except Exception as error:  # noqa: B902
+            result[1] += 1
+            if result[2] is None:
+                result[2] = f"{method.upper()} {path}: {error}"
+    return results
+
+
+def merge_results(results: Dict[Operation, List[Any]], batch: Dict[Operation, List[Any]]) -> None:
+    for operation, (validated, failed, message) in batch.items():
+        result = results.setdefault(operation, [0, 0, None])
+        result[0] += validated
+        result[1] += failed
+        result[2] = result[2] or message
+
+
+def batched(items: Iterable[Item], batch_size: int) -> Iterator[List[Item]]:
+    batch: List[Item] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def validate_traffic(
+    file_paths: List[str], workers: Optional[int] = None, batch_size: int = 100, **options: Any
+) -> Dict[Operation, List[Any]]:
+    """
+    Validates the JSON responses in recorded traffic against the OpenAPI schema.
+
+    :param file_paths: HAR files, or JSON-lines files
+    :param workers: The number of worker processes, defaults to the number of CPUs. With 1 worker, responses are
+        validated in this process
+    :param batch_size: The number of responses sent to a worker at a time
+    :param options: Schema tester arguments, overriding the OPENAPI_TESTER Django setting
+    :return: [validated, failed, first error message] per operation
+    """
+    tester = SchemaTester(**get_tester_options(options))
+    items = (item for file_path in file_paths for item in iter_capture(file_path))
+    results: Dict[Operation, List[Any]] = {}
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for batch in batched(items, batch_size):
+            merge_results(results, validate_items(batch, tester))
+        return results
+
+    with tempfile.TemporaryDirectory() as directory:
+        shared_schema_path = os.path.join(directory, "schema.shared")
+        source_hash = tester.loader.export_shared_schema(shared_schema_path)
+        initargs = (options, shared_schema_path, source_hash)
+        with ProcessPoolExecutor(workers, initializer=init_worker, initargs=initargs) as pool:
+            # only a couple of batches per worker are read ahead, so memory use doesn't depend on the capture size
+            pending: List[Future] = []
+            for batch in batched(items, batch_size):
+                pending.append(pool.submit(validate_items, batch))
+                if len(pending) >= workers * 2:
+                    merge_results(results, pending.pop(0).result())
+            for future in pending:
+                merge_results(results, future.result())
+    return results
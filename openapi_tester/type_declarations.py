@@ -47,11 +47,16 @@ else:
     # noinspection PyUnresolvedReferences
     from openapi_tester.loaders import BaseSchemaLoader, StaticSchemaLoader
 
+    # noinspection PyUnresolvedReferences
+    from openapi_tester.sampling import ArraySampler
+
     class OpenAPITestCase(APITestCase):
         def assertResponse(
             self,
             response: Response,
             case_tester: Optional[Callable[[str], None]] = None,
             ignore_case: Optional[List[str]] = None,
+            array_sampling: Optional[ArraySampler] = None,
+            collect_errors: bool = False,
         ) -> None:
             ...
@@ -1,6 +1,12 @@
 import pytest
 
-from openapi_tester.case_testers import is_camel_case, is_kebab_case, is_pascal_case, is_snake_case
+from openapi_tester.case_testers import (
+    create_case_tester,
+    is_camel_case,
+    is_kebab_case,
+    is_pascal_case,
+    is_snake_case,
+)
 from openapi_tester.exceptions import CaseError
 
 camel_case_test_data = [
@@ -138,3 +144,24 @@ def test_snake_case_less_than_two_chars():
         is_snake_case(None)
         is_snake_case("%")
         is_snake_case("R")
+
+
+def test_verdicts_are_cached():
+    calls = []
+
+    def is_upper(key):
+        calls.append(key)
+        return key.upper()
+
+    tester = create_case_tester("UPPER CASED", is_upper, cache_size=2)
+    for _ in range(3):
+        tester("ID")
+        with pytest.raises(CaseError, match="not properly UPPER CASED. Expected value: IP"):
+            tester("ip")
+    assert calls == ["ID", "ip", "ip"]
+    assert tester.cache_info().hits == 4
+
+    tester("URL")
+    tester("ID")
+    assert tester.cache_info().currsize == 2
+    assert calls[-1] == "ID"
@@ -0,0 +1,61 @@
+import json
+from xml.etree import ElementTree
+
+import pytest
+
+from openapi_tester import SchemaTester, UndocumentedSchemaSectionError
+from openapi_tester.coverage import EndpointCoverage
+
+schema = {
+    "paths": {
+        "/api/{version}/cars/correct": {
+            "parameters": [],
+            "get": {"responses": {"200": {}, "404": {}, "default": {}}},
+            "post": {"responses": {"201": {}}},
+        },
+    }
+}
+
+
+def test_coverage_report(client):
+    tester = SchemaTester()
+    tester.validate_response(client.get("/api/v1/cars/correct"))
+    tester.validate_response(client.get("/api/v1/cars/correct"))
+    with pytest.raises(UndocumentedSchemaSectionError):
+        tester.validate_response(client.delete("/api/v1/cars/correct"))
+    assert tester.coverage.counter == {
+        ("/api/{version}/cars/correct", "get", "200"): 2,
+        ("/api/{version}/cars/correct", "delete", "200"): 1,
+    }
+    report = tester.coverage.get_report(schema)
+    assert report == {
+        "documented": 3,
+        "coverage": 0.3333,
+        "validated": [{"path": "/api/{version}/cars/correct", "method": "get", "status_code": "200", "count": 2}],
+        "undocumented": [{"path": "/api/{version}/cars/correct", "method": "delete", "status_code": "200", "count": 1}],
+        "not_validated": [
+            {"path": "/api/{version}/cars/correct", "method": "get", "status_code": "404", "count": 0},
+            {"path": "/api/{version}/cars/correct", "method": "post", "status_code": "201", "count": 0},
+        ],
+    }
+    assert tester.get_coverage_report()["validated"] == report["validated"]
+
+
+def test_coverage_report_files(tmp_path):
+    coverage = EndpointCoverage()
+    coverage.record(("/api/{version}/cars/correct", "get", "200"))
+    coverage.record(("/api/{version}/cars/correct", "put", "200"))
+    report = coverage.get_report(schema)
+
+    EndpointCoverage.write_json(report, str(tmp_path / "coverage.json"))
+    assert json.loads((tmp_path / "coverage.json").read_text()) == report
+
+    EndpointCoverage.write_junit(report, str(tmp_path / "coverage.xml"))
+    suite = ElementTree.parse(str(tmp_path / "coverage.xml")).getroot()
+    assert suite.attrib == {"name": "openapi-coverage", "tests": "4", "failures": "1", "skipped": "2"}
+    assert [(case.attrib["classname"], case.attrib["name"], [child.tag for child in case]) for case in suite] == [
+        ("GET /api/{version}/cars/correct", "200", []),
+        ("PUT /api/{version}/cars/correct", "200", ["failure"]),
+        ("GET /api/{version}/cars/correct", "404", ["skipped"]),
+        ("POST /api/{version}/cars/correct", "201", ["skipped"]),
+    ]
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from openapi_tester.exceptions import CaseError, DocumentationError
 
 
@@ -42,6 +44,16 @@ Sequence: test:reference
     assert error.args[0].strip() == expected.strip()
 
 
+def test_documentation_error_message_is_rendered_lazily():
+    with patch("openapi_tester.exceptions.SchemaToPythonConverter") as converter:
+        converter.return_value.result = "str"
+        error = DocumentationError(message="Test error message", response="test", schema={"type": "string"})
+        converter.assert_not_called()
+        assert error.message == "Test error message"
+        assert str(error) == str(error) == "Error: Test error message\n\nExpected: null\n\nReceived: null\n\n"
+        converter.assert_called_once()
+
+
 def test_case_error_message():
     error = CaseError(key="test-key", case="camelCase", expected="testKey")
     assert error.args[0].strip() == "The response key `test-key` is not properly camelCase. Expected value: testKey"
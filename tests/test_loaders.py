@@ -1,8 +1,25 @@
+import json
+import marshal
+import os
+from unittest.mock import patch
+
 import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.test import override_settings
+from django.urls import re_path
+from openapi_spec_validator.exceptions import OpenAPIValidationError
 
+from openapi_tester import SchemaTester
+from openapi_tester.constants import SHARED_SCHEMA_ENV_VAR, SHARED_SCHEMA_HASH_ENV_VAR
+from openapi_tester.exceptions import OpenAPISchemaError
 from openapi_tester.loaders import BaseSchemaLoader, DrfSpectacularSchemaLoader, DrfYasgSchemaLoader, StaticSchemaLoader
+from openapi_tester.shared_schema import SharedPaths
+from test_project.api.views.items import Items
 from tests.utils import CURRENT_PATH
 
+# used as a URLconf by test_parameterize_path_with_unnamed_groups
+urlpatterns = [re_path(r"^api/(v1|v2)/items$", Items.as_view())]
+
 
 def test_drf_spectacular_get_schemas():
     loader = DrfSpectacularSchemaLoader()
@@ -24,6 +41,26 @@ def test_static_get_schema():
         loader.get_schema()
 
 
+def test_static_schema_format(tmp_path):
+    schema_file = tmp_path / "schema"
+    schema_file.write_bytes((CURRENT_PATH / "schemas" / "test_project_schema.json").read_bytes())
+    loader = StaticSchemaLoader(str(schema_file))
+    assert loader.get_schema_format(schema_file.read_bytes()) == "json"
+    assert loader.load_schema()["openapi"]
+    assert loader.parse_time is not None
+
+    schema_file.write_bytes((CURRENT_PATH / "schemas" / "test_project_schema.yaml").read_bytes())
+    assert loader.get_schema_format(schema_file.read_bytes()) == "yaml"
+    assert (
+        loader.load_schema()
+        == StaticSchemaLoader(str(CURRENT_PATH) + "/schemas/test_project_schema.yaml").load_schema()
+    )
+
+    assert StaticSchemaLoader("schema.JSON").get_schema_format(b"openapi: 3.0.0") == "json"
+    assert StaticSchemaLoader("schema.yml").get_schema_format(b'{"openapi": "3.0.0"}') == "yaml"
+    assert StaticSchemaLoader("schema.txt").get_schema_format(b'\xef\xbb\xbf\n  {"openapi": "3.0.0"}') == "json"
+
+
 def test_base_loader_get_route():
     for _loader in [BaseSchemaLoader, DrfYasgSchemaLoader, DrfSpectacularSchemaLoader]:
         loader = _loader()
@@ -35,3 +72,292 @@ def test_base_loader_get_route():
         assert loader.parameterize_path("/api/v1/snake-case") == "/api/{version}/snake-case/"
         assert loader.parameterize_path("api/v1/snake-case/") == "/api/{version}/snake-case/"
         assert loader.parameterize_path("api/v1/snake-case") == "/api/{version}/snake-case/"
+
+
+def test_parameterize_path_is_cached():
+    loader = BaseSchemaLoader()
+    loader.route_cache_size = 2
+    with patch.object(BaseSchemaLoader, "resolve_path", wraps=loader.resolve_path) as resolve_path:
+        for _ in range(3):
+            assert loader.parameterize_path("/api/v1/items") == "/api/{version}/items"
+        assert resolve_path.call_count == 1
+        assert loader.parameterize_path("/api/v1/items/") == "/api/{version}/items"
+        assert loader.parameterize_path("api/v1/items") == "/api/{version}/items"
+        assert resolve_path.call_count == 3
+        assert list(loader._route_cache) == ["/api/v1/items/", "api/v1/items"]
+
+        loader.clear_route_cache()
+        assert loader.parameterize_path("api/v1/items") == "/api/{version}/items"
+        assert resolve_path.call_count == 4
+
+        # path prefix settings change how paths are parameterized
+        for setting in ["SPECTACULAR_SETTINGS", "SWAGGER_SETTINGS", "OPENAPI_TESTER"]:
+            with override_settings(**{setting: {}}):
+                assert list(loader._route_cache) == []
+            loader.parameterize_path("api/v1/items")
+
+
+def test_parameterize_path_with_unnamed_groups():
+    with override_settings(ROOT_URLCONF="tests.test_loaders"):
+        loader = BaseSchemaLoader()
+        assert loader.parameterize_path("/api/v1/items") == "/api/v1/items"
+        assert loader.parameterize_path("/api/v2/items") == "/api/v2/items"
+
+
+def test_drf_yasg_path_prefix_is_computed_once():
+    loader = DrfYasgSchemaLoader()
+    for path in ["/api/v1/items", "/api/v1/cars/correct", "/api/v1/snake-case/"]:
+        loader.parameterize_path(path)
+        loader.resolve_path(path)
+    assert loader.path_prefix_computations == 1
+
+    with override_settings(ROOT_URLCONF="test_project.urls"):
+        assert loader.parameterize_path("/api/v1/items") == "/api/{version}/items"
+    assert loader.path_prefix_computations == 2
+
+
+def test_schema_cache(tmp_path):
+    schema_path = str(CURRENT_PATH) + "/schemas/test_project_schema.yaml"
+    loader = StaticSchemaLoader(schema_path, cache_dir=tmp_path)
+    schema = loader.get_schema()
+    assert len(list(tmp_path.glob("*.marshal"))) == 1
+
+    cached_loader = StaticSchemaLoader(schema_path, cache_dir=tmp_path)
+    with patch.object(StaticSchemaLoader, "de_reference_schema") as de_reference_schema:
+        with patch.object(StaticSchemaLoader, "validate_schema") as validate_schema:
+            assert cached_loader.get_schema() == schema
+    de_reference_schema.assert_not_called()
+    validate_schema.assert_not_called()
+
+    for _loader in [DrfSpectacularSchemaLoader, DrfYasgSchemaLoader]:
+        loader = _loader(cache_dir=tmp_path)
+        assert _loader(cache_dir=tmp_path).get_schema() == loader.get_schema()
+    assert len(list(tmp_path.glob("*.marshal"))) == 3
+
+
+def test_unreadable_schema_cache_files_are_ignored(tmp_path):
+    schema_path = str(CURRENT_PATH) + "/schemas/test_project_schema.json"
+    schema = StaticSchemaLoader(schema_path, cache_dir=tmp_path).get_schema()
+    (cache_path,) = tmp_path.glob("*.marshal")
+    for content in [cache_path.read_bytes()[:100], b"\x80\x04\x95garbage", marshal.dumps(["not", "a", "schema"])]:
+        cache_path.write_bytes(content)
+        assert StaticSchemaLoader(schema_path, cache_dir=tmp_path).get_schema() == schema
+        assert isinstance(marshal.loads(cache_path.read_bytes()), dict)
+
+
+def test_schema_validation_policies(tmp_path):
+    schema_path = str(CURRENT_PATH) + "/schemas/test_project_schema.json"
+    with patch.object(StaticSchemaLoader, "validate_schema") as validate_schema:
+        StaticSchemaLoader(schema_path, validation="never").get_schema()
+        assert validate_schema.call_count == 0
+
+        for _ in range(2):
+            StaticSchemaLoader(schema_path, cache_dir=tmp_path, validation="once").get_schema()
+        assert validate_schema.call_count == 1
+        assert len(list(tmp_path.glob("*.valid"))) == 1
+
+        loader = StaticSchemaLoader(schema_path, validation="background")
+        loader.get_schema()
+        loader.wait_for_validation()
+        assert validate_schema.call_count == 2
+
+    with pytest.raises(ImproperlyConfigured, match="Unknown schema validation policy `sometimes`"):
+        StaticSchemaLoader(schema_path, validation="sometimes")
+
+
+def test_unvalidated_schemas_are_not_cached(tmp_path):
+    schema_path = tmp_path / "schema.json"
+    components = {"schemas": {"Name": {"type": "string", "pattern": "("}}}
+    schema_path.write_text(json.dumps({"openapi": "3.0.0", "paths": {}, "components": components}))
+    cache_dir = tmp_path / "cache"
+    StaticSchemaLoader(str(schema_path), cache_dir=cache_dir, validation="never").get_schema()
+    assert list(cache_dir.glob("*.marshal")) == []
+    with pytest.raises(OpenAPIValidationError, match="'info' is a required property"):
+        StaticSchemaLoader(str(schema_path), cache_dir=cache_dir, validation="always").get_schema()
+
+
+def test_background_validation_errors_are_raised():
+    loader = StaticSchemaLoader(str(CURRENT_PATH) + "/schemas/test_project_schema.json", validation="background")
+    with patch.object(StaticSchemaLoader, "validate_schema", side_effect=OpenAPISchemaError("invalid")):
+        loader.get_schema()
+        with pytest.raises(OpenAPISchemaError, match="invalid"):
+            loader.wait_for_validation()
+    with pytest.raises(OpenAPISchemaError, match="invalid"):
+        loader.get_schema()
+
+
+def test_shared_schema(tmp_path, monkeypatch):
+    schema_path = str(CURRENT_PATH) + "/schemas/test_project_schema.yaml"
+    shared_schema_path = str(tmp_path / "schema.shared")
+    StaticSchemaLoader(schema_path).export_shared_schema(shared_schema_path)
+    monkeypatch.setenv(SHARED_SCHEMA_ENV_VAR, shared_schema_path)
+
+    loader = StaticSchemaLoader(schema_path)
+    with patch.object(StaticSchemaLoader, "load_schema") as load_schema:
+        schema = loader.get_schema()
+    load_schema.assert_not_called()
+    assert isinstance(schema["paths"], SharedPaths)
+    assert "/api/{version}/cars/correct" in schema["paths"]
+    assert schema["paths"]._items == {}
+    assert {**schema, "paths": dict(schema["paths"])} == StaticSchemaLoader(schema_path).get_schema()
+
+    # loaders for other schema sources ignore the shared schema
+    assert not isinstance(DrfSpectacularSchemaLoader().get_schema()["paths"], SharedPaths)
+
+
+def test_generated_shared_schema(tmp_path, monkeypatch):
+    shared_schema_path = str(tmp_path / "schema.shared")
+    source_hash = DrfSpectacularSchemaLoader().export_shared_schema(shared_schema_path)
+    monkeypatch.setenv(SHARED_SCHEMA_ENV_VAR, shared_schema_path)
+
+    # without the hash, the schema is generated to check the shared schema, and only generated once if it's outdated
+    with patch.object(DrfSpectacularSchemaLoader, "get_schema_hash", return_value="outdated"):
+        loader = DrfSpectacularSchemaLoader()
+        with patch.object(loader, "load_schema", wraps=loader.load_schema) as load_schema:
+            assert not isinstance(loader.get_schema()["paths"], SharedPaths)
+    assert load_schema.call_count == 1
+
+    monkeypatch.setenv(SHARED_SCHEMA_HASH_ENV_VAR, source_hash)
+    loader = DrfSpectacularSchemaLoader()
+    with patch.object(loader, "load_schema") as load_schema:
+        assert isinstance(loader.get_schema()["paths"], SharedPaths)
+    load_schema.assert_not_called()
+
+
+def test_outdated_shared_schema_is_ignored(tmp_path, monkeypatch):
+    schema_path = tmp_path / "schema.json"
+    schema_path.write_text((CURRENT_PATH / "schemas" / "test_project_schema.json").read_text())
+    shared_schema_path = str(tmp_path / "schema.shared")
+    StaticSchemaLoader(str(schema_path)).export_shared_schema(shared_schema_path)
+    monkeypatch.setenv(SHARED_SCHEMA_ENV_VAR, shared_schema_path)
+
+    schema = json.loads(schema_path.read_text())
+    schema["info"]["title"] = "Changed"
+    schema_path.write_text(json.dumps(schema))
+    loaded_schema = StaticSchemaLoader(str(schema_path)).get_schema()
+    assert not isinstance(loaded_schema["paths"], SharedPaths)
+    assert loaded_schema["info"]["title"] == "Changed"
+
+
+def test_invalid_patterns_are_reported_when_loading():
+    schema = {
+        "paths": {
+            "/api/{version}/items": {
+                "parameters": [{"name": "version", "in": "path", "pattern": "v[0-9"}],
+                "get": {
+                    "responses": {
+                        "200": {
+                            "properties": {
+                                "pattern": {"type": "string", "pattern": "**"},
+                                "name": {"type": "string", "pattern": "^[a-z]+$", "example": {"pattern": "("}},
+                            }
+                        }
+                    }
+                },
+            }
+        }
+    }
+    with pytest.raises(OpenAPISchemaError) as e:
+        BaseSchemaLoader.validate_patterns(schema)
+    assert str(e.value).splitlines()[2:] == [
+        "\t• #/paths/~1api~1{version}~1items/get/responses/200/properties/pattern/pattern: `**` "
+        "(nothing to repeat at position 0)",
+        "\t• #/paths/~1api~1{version}~1items/parameters/0/pattern: `v[0-9` "
+        "(unterminated character set at position 1)",
+    ]
+
+
+def watched_schema(car_properties, truck_properties):
+    def path_item(schema):
+        return {"get": {"responses": {"200": {"description": "", "content": {"application/json": {"schema": schema}}}}}}
+
+    return {
+        "openapi": "3.0.0",
+        "info": {"title": "", "version": ""},
+        "paths": {
+            "/api/v1/cars/correct": path_item({"$ref": "#/components/schemas/Car"}),
+            "/api/v1/trucks/correct": path_item({"type": "object", "properties": truck_properties}),
+        },
+        "components": {"schemas": {"Car": {"type": "object", "properties": car_properties}}},
+    }
+
+
+@pytest.mark.parametrize("preserve_references", [False, True])
+def test_watched_schema_is_reloaded(tmp_path, preserve_references):
+    schema_file = tmp_path / "schema.json"
+    name = {"name": {"type": "string"}}
+
+    def write(schema):
+        schema_file.write_text(json.dumps(schema))
+        stat = schema_file.stat()
+        os.utime(schema_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    write(watched_schema(name, name))
+    loader = StaticSchemaLoader(str(schema_file), preserve_references=preserve_references, watch=True, watch_interval=0)
+    schema = loader.get_schema()
+    cars, trucks = schema["paths"]["/api/{version}/cars/correct"], schema["paths"]["/api/{version}/trucks/correct"]
+    assert loader.get_schema() is schema
+
+    # a changed component changes the paths that reference it
+    write(watched_schema({"name": {"type": "integer"}}, name))
+    reloaded_schema = loader.get_schema()
+    assert reloaded_schema is not schema
+    assert reloaded_schema["paths"]["/api/{version}/cars/correct"] is not cars
+    assert reloaded_schema["paths"]["/api/{version}/trucks/correct"] is trucks
+    assert loader.get_changed_paths(schema) == {"/api/{version}/cars/correct"}
+    assert loader.get_changed_paths(reloaded_schema) is None
+
+    # touching the file without changing it doesn't reload it
+    write(watched_schema({"name": {"type": "integer"}}, name))
+    assert loader.get_schema() is reloaded_schema
+
+    # anything but paths and components changing reloads everything
+    changed_schema = watched_schema({"name": {"type": "integer"}}, name)
+    changed_schema["info"]["version"] = "2"
+    write(changed_schema)
+    assert loader.get_schema() is not reloaded_schema
+    assert loader.get_changed_paths(reloaded_schema) is None
+
+
+def test_watched_schema_recovers_from_background_validation_errors(tmp_path):
+    schema_file = tmp_path / "schema.json"
+    name, invalid_name = {"name": {"type": "string"}}, {"name": {"type": "string", "pattern": "("}}
+
+    def write(schema):
+        schema_file.write_text(json.dumps(schema))
+        stat = schema_file.stat()
+        os.utime(schema_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    write(watched_schema(name, name))
+    loader = StaticSchemaLoader(str(schema_file), validation="background", watch=True, watch_interval=0)
+    loader.get_schema()
+    loader.wait_for_validation()
+
+    write(watched_schema(invalid_name, name))
+    with pytest.raises(OpenAPISchemaError):
+        loader.get_schema()
+        loader.wait_for_validation()
+
+    # the invalid component is still there, even though only another path changed
+    write(watched_schema(invalid_name, {"name": {"type": "integer"}}))
+    with pytest.raises(OpenAPISchemaError):
+        loader.get_schema()
+        loader.wait_for_validation()
+
+    write(watched_schema(name, {"name": {"type": "integer"}}))
+    loader.get_schema()
+    loader.wait_for_validation()
+    assert loader.get_schema()["components"]["schemas"]["Car"]["properties"] == name
+    schema_file = tmp_path / "schema.json"
+    name = {"name": {"type": "string"}}
+    schema_file.write_text(json.dumps(watched_schema(name, name)))
+    tester = SchemaTester(schema_file_path=str(schema_file), watch_schema=True)
+    tester.loader.watch_interval = 0
+    cars, trucks = ("/api/{version}/cars/correct", "get", "200"), ("/api/{version}/trucks/correct", "get", "200")
+    compiled_cars = tester._get_compiled_operation_section(cars)
+    compiled_trucks = tester._get_compiled_operation_section(trucks)
+
+    schema_file.write_text(json.dumps(watched_schema(name, {"name": {"type": "integer"}})))
+    assert tester._get_compiled_operation_section(cars) is compiled_cars
+    assert tester._get_compiled_operation_section(trucks) is not compiled_trucks
+    tester.test_schema_section(tester._get_compiled_operation_section(trucks).schema, {"name": 1})
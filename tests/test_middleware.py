@@ -0,0 +1,124 @@
+import threading
+
+import pytest
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpResponse, JsonResponse
+from django.test import RequestFactory, override_settings
+from django.urls import resolve
+
+from openapi_tester import SchemaTester
+from openapi_tester.middleware import BackgroundValidator, ResponseValidationMiddleware, response_validation_failed
+
+key = ("get", "/api/v1/cars/correct", "200")
+
+
+@pytest.fixture
+def failures():
+    received = []
+
+    def receiver(sender, **kwargs):
+        received.append(kwargs)
+
+    response_validation_failed.connect(receiver)
+    yield received
+    response_validation_failed.disconnect(receiver)
+
+
+@pytest.fixture
+def cars(client):
+    return client.get("/api/v1/cars/correct").json(), client.get("/api/v1/cars/incorrect").json()
+
+
+def validate(validator, data):
+    validator.submit((key, "/api/v1/cars/correct", "GET", 200, JsonResponse(data, safe=False).content))
+    validator.queue.join()
+
+
+def test_background_validator(cars, failures, caplog):
+    validator = BackgroundValidator(SchemaTester())
+    validate(validator, cars[0])
+    assert validator.validated == 1
+    assert failures == []
+
+    validate(validator, cars[1])
+    assert [failure["operation"] for failure in failures] == [key]
+    assert isinstance(failures[0]["error"], AssertionError)
+    assert "GET /api/v1/cars/correct returned a 200 response that doesn't match the OpenAPI schema" in caplog.text
+    validator.stop()
+
+
+def test_errors_are_rate_limited(cars, failures):
+    validator = BackgroundValidator(SchemaTester(), report_interval=60)
+    for _ in range(3):
+        validate(validator, cars[1])
+    assert len(failures) == 1
+    assert validator.errors[key][1] == 2
+
+    validator.report_interval = 0
+    validate(validator, cars[1])
+    assert [failure["suppressed"] for failure in failures] == [0, 2]
+    validator.stop()
+
+
+def test_samples_are_dropped_when_the_queue_is_full(caplog):
+    release = threading.Event()
+
+    class BlockingTester:
+        def validate_data(self, *args):
+            release.wait()
+
+    validator = BackgroundValidator(BlockingTester(), queue_size=1)
+    sample = (key, "/api/v1/cars/correct", "GET", 200, b"{}")
+    results = [validator.submit(sample) for _ in range(4)]
+    release.set()
+    validator.queue.join()
+    # the second sample is only queued if the background thread has taken the first off the queue by then
+    assert results[:1] == [True] and results[-1] is False
+    assert validator.dropped == results.count(False)
+    assert "the validation queue is full" in caplog.text
+    validator.stop()
+
+
+def test_middleware_samples_json_responses(cars):
+    response = JsonResponse(cars[0], safe=False)
+
+    def get_response(request):
+        # the URL resolver sets this before views are called
+        request.resolver_match = resolve(request.path_info)
+        return response
+
+    with override_settings(OPENAPI_TESTER={"SAMPLE_RATE": 1}):
+        middleware = ResponseValidationMiddleware(get_response)
+    samples = []
+    middleware.validator.submit = samples.append  # type: ignore
+
+    assert middleware(RequestFactory().get("/api/v1/cars/correct")) is response
+    route_key = ("get", "api/<version:version>/cars/correct", "200")
+    assert samples == [(route_key, "/api/v1/cars/correct", "GET", 200, response.content)]
+
+    middleware.get_response = lambda request: HttpResponse("<html></html>")
+    middleware(RequestFactory().get("/api/v1/cars/correct"))
+    assert len(samples) == 1
+
+    # responses to paths that don't match a URL pattern are never sampled
+    middleware.get_response = lambda request: JsonResponse({"detail": "Not found."}, status=404)
+    middleware(RequestFactory().get("/wp-login.php"))
+    assert len(samples) == 1
+
+
+def test_report_keys_are_bounded(failures):
+    validator = BackgroundValidator(SchemaTester(), max_report_keys=2)
+    for path in ["/a", "/b", "/b", "/c"]:
+        validator.report(("get", path, "200"), "Error", error=AssertionError())
+    assert list(validator.errors) == [("get", "/b", "200"), ("get", "/c", "200")]
+    assert len(failures) == 3
+
+    # forgotten keys are reported again
+    validator.report(("get", "/a", "200"), "Error", error=AssertionError())
+    assert list(validator.errors) == [("get", "/c", "200"), ("get", "/a", "200")]
+    assert len(failures) == 4
+
+
+def test_middleware_is_disabled_without_a_sample_rate():
+    with override_settings(OPENAPI_TESTER={"SAMPLE_RATE": 0}), pytest.raises(MiddlewareNotUsed):
+        ResponseValidationMiddleware(lambda request: HttpResponse())
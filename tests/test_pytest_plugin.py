@@ -0,0 +1,135 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+from django.test import override_settings
+
+from openapi_tester import SchemaTester, is_camel_case, is_snake_case
+from openapi_tester.pytest_plugin import SchemaTesterPlugin, get_schema_tester_options
+from tests.utils import CURRENT_PATH
+
+
+def test_schema_tester_fixture(schema_tester, request):
+    assert isinstance(schema_tester, SchemaTester)
+    assert schema_tester.loader.schema is not None
+    assert request.getfixturevalue("schema_tester") is schema_tester
+
+
+def test_assert_response_fixture(assert_response, client):
+    assert_response(client.get("/api/v1/cars/correct"))
+    with pytest.raises(AssertionError):
+        assert_response(client.get("/api/v1/cars/incorrect"))
+
+
+class IniConfig:
+    def __init__(self, **ini):
+        self.ini = ini
+
+    def getini(self, name):
+        return self.ini.get(name)
+
+
+class WorkerConfig(IniConfig):
+    def __init__(self, **ini):
+        super().__init__(**ini)
+        self.workerinput = {"workerid": "gw0"}
+        self.workeroutput = {}
+
+
+def test_xdist_worker_results_are_merged(client):
+    worker = SchemaTesterPlugin(WorkerConfig())
+    worker.tester = SchemaTester()
+    worker.load_time = 0.5
+    worker.tester.validate_response(client.get("/api/v1/cars/correct"))
+    worker.validation_count = 1
+    worker.pytest_sessionfinish(SimpleNamespace(exitstatus=0))
+    assert set(worker.config.workeroutput) == {"openapi_tester"}
+
+    controller = SchemaTesterPlugin(IniConfig())
+    for _ in range(2):
+        controller.pytest_testnodedown(SimpleNamespace(workeroutput=worker.config.workeroutput), None)
+    controller.pytest_testnodedown(SimpleNamespace(workeroutput={}), None)
+    operation = ("/api/{version}/cars/correct", "get", "200")
+    assert controller.load_time == 0.5
+    assert controller.validation_count == 2
+    assert controller.tester.coverage.counter == {operation: 2}
+    assert controller.tester.stats.timings[(operation, "validate")][0] == 2
+    assert controller.tester.loader.validation == "never"
+
+
+def test_schema_tester_options(pytestconfig):
+    options = {"schema_file_path": None, "case_tester": None, "ignore_case": None, "schema_cache_dir": None}
+    options.update(watch_schema=False, schema_validation="always")
+    assert get_schema_tester_options(pytestconfig) == {**options, "preserve_references": False}
+
+    schema_file_path = str(CURRENT_PATH) + "/schemas/test_project_schema.yaml"
+    django_options = {"SCHEMA_FILE_PATH": schema_file_path, "CASE_TESTER": "camel_case", "IGNORE_CASE": ["IP"]}
+    with override_settings(OPENAPI_TESTER=django_options):
+        assert get_schema_tester_options(pytestconfig) == {
+            **options,
+            "schema_file_path": schema_file_path,
+            "case_tester": is_camel_case,
+            "ignore_case": ["IP"],
+            "preserve_references": False,
+        }
+
+        config = IniConfig(openapi_tester_case_tester="openapi_tester.is_snake_case", openapi_tester_ignore_case=["ID"])
+        assert get_schema_tester_options(config) == {
+            **options,
+            "schema_file_path": schema_file_path,
+            "case_tester": is_snake_case,
+            "ignore_case": ["ID"],
+            "preserve_references": False,
+        }
+
+
+def test_load_and_validation_times_are_reported(pytester, monkeypatch):
+    monkeypatch.setenv("PYTHONPATH", str(CURRENT_PATH.parent))
+    pytester.makeconftest('pytest_plugins = ["openapi_tester.pytest_plugin"]')
+    pytester.makepyfile(
+        """
+        def test_response(assert_response, client):
+            assert_response(client.get("/api/v1/cars/correct"))
+        """
+    )
+    pytester.makeini(
+        "[pytest]\nopenapi_tester_coverage_report = coverage.json\nopenapi_tester_stats_report = stats.json"
+    )
+    result = pytester.runpytest_subprocess("--ds", "test_project.settings")
+    result.assert_outcomes(passed=1)
+    result.stdout.fnmatch_lines(
+        [
+            "*openapi-tester*",
+            "Schema loaded in *s",
+            "1 responses validated in *s",
+            "Slowest responses:",
+            "  *s GET /api/{version}/cars/correct 200 (1 validated)",
+            "Timing report written to stats.json",
+            "1 of * documented responses validated (*%)",
+            "Coverage report written to coverage.json",
+        ]
+    )
+    assert json.loads((pytester.path / "coverage.json").read_text())["validated"] == [
+        {"path": "/api/{version}/cars/correct", "method": "get", "status_code": "200", "count": 1}
+    ]
+    stats = json.loads((pytester.path / "stats.json").read_text())
+    assert [entry["path"] for entry in stats["operations"]] == ["/api/{version}/cars/correct"]
+
+
+def test_invalid_schema_validated_in_the_background_fails_the_session(pytester, monkeypatch):
+    monkeypatch.setenv("PYTHONPATH", str(CURRENT_PATH.parent))
+    pytester.makeconftest('pytest_plugins = ["openapi_tester.pytest_plugin"]')
+    pytester.makefile(".json", schema=json.dumps({"openapi": "3.0.0", "paths": {}}))
+    pytester.makeini(
+        "[pytest]\nopenapi_tester_schema_file_path = schema.json\nopenapi_tester_schema_validation = background"
+    )
+    pytester.makepyfile(
+        """
+        def test_schema(schema_tester):
+            assert schema_tester.loader.schema is not None
+        """
+    )
+    result = pytester.runpytest_subprocess("--ds", "test_project.settings")
+    result.assert_outcomes(passed=1)
+    assert result.ret == 1
+    result.stdout.fnmatch_lines(["The schema is invalid: *'info' is a required property*"])
@@ -0,0 +1,41 @@
+import pytest
+
+from openapi_tester import DocumentationError
+from openapi_tester.sampling import first_last_random, first_n, stride
+from openapi_tester.schema_tester import SchemaTester
+
+tester = SchemaTester()
+schema = {"type": "array", "items": {"type": "integer"}}
+
+
+def test_sampling_policies():
+    assert list(first_n(3)(10)) == [0, 1, 2]
+    assert list(first_n(3)(2)) == [0, 1]
+    assert list(stride(4)(10)) == [0, 4, 8]
+    sample = first_last_random(3, seed=1)(100)
+    assert len(sample) == 5
+    assert sample[0] == 0 and sample[-1] == 99
+    assert sample == sorted(set(sample))
+    assert sample == first_last_random(3, seed=1)(100)
+    assert list(first_last_random(3)(4)) == [0, 1, 2, 3]
+    for policy in [first_n, stride]:
+        with pytest.raises(ValueError):
+            policy(0)
+
+
+def test_array_sampling():
+    data = [1] * 100
+    data[50] = "1"
+    with pytest.raises(DocumentationError) as e:
+        tester.test_schema_section(schema, data, reference="init")
+    assert e.value.reference == "init.list"
+
+    tester.test_schema_section(schema, data, reference="init", array_sampling=first_n(10))
+    with pytest.raises(DocumentationError) as e:
+        tester.test_schema_section(schema, data, reference="init", array_sampling=stride(25))
+    assert e.value.reference == "init.list:index:50"
+
+    sampling_tester = SchemaTester(array_sampling=stride(25))
+    with pytest.raises(DocumentationError) as e:
+        sampling_tester.test_schema_section(schema, data, reference="init")
+    assert e.value.reference == "init.list:index:50"
@@ -12,6 +12,7 @@ from openapi_tester import (
     StaticSchemaLoader,
     UndocumentedSchemaSectionError,
     is_pascal_case,
+    is_snake_case,
 )
 from openapi_tester.schema_tester import SchemaTester
 from tests.utils import CURRENT_PATH, iterate_schema, load_schema, pass_mock_value, response_factory
@@ -187,6 +188,26 @@ def test_validate_response_passed_in_ignored_case(client):
     )
 
 
+def test_undeclared_keys_are_case_tested():
+    schema = {"type": "object", "properties": {"Name": {"type": "string"}}, "additionalProperties": {"type": "string"}}
+    tester.test_schema_section(schema, {"Name": "Saab", "Color": "Yellow"}, case_tester=is_pascal_case)
+    with pytest.raises(CaseError, match="The response key `color` is not properly PascalCased"):
+        tester.test_schema_section(schema, {"Name": "Saab", "color": "Yellow"}, case_tester=is_pascal_case)
+    tester.test_schema_section(
+        schema, {"Name": "Saab", "color": "Yellow"}, case_tester=is_pascal_case, ignore_case=["color"]
+    )
+
+
+def test_audit_key_casing():
+    tester_with_case_tester = SchemaTester(case_tester=is_pascal_case, ignore_case=["width"])
+    assert tester_with_case_tester.audit_key_casing() == {
+        "#/components/schemas/Car": ["color", "height", "length", "name"],
+        "#/components/schemas/SnakeCase": ["this_is_snake_case"],
+    }
+    assert tester_with_case_tester.audit_key_casing(case_tester=is_snake_case) == {}
+    assert tester.audit_key_casing() == {}
+
+
 def test_reference_schema():
     schema_path = str(CURRENT_PATH) + "/schemas"
     for schema_file in [
@@ -229,3 +250,123 @@ def test_one_of_any_of_schemas():
             with patch.object(StaticSchemaLoader, "parameterize_path", side_effect=pass_mock_value(url_fragment)):
                 tester.validate_response(response)
                 assert sorted(tester.get_response_schema_section(response)) == sorted(schema_section)
+
+
+def test_compiled_schema_sections_are_reused(client):
+    response = client.get(de_parameterized_path)
+    tester.validate_response(response)
+    compiled_section = tester.get_compiled_schema_section(response)
+    tester.validate_response(client.get(de_parameterized_path))
+    assert tester.get_compiled_schema_section(response) is compiled_section
+    assert tester._compiled_sections == {(parameterized_path, method, status): compiled_section}
+
+
+def test_preserved_references():
+    schema_path = str(CURRENT_PATH) + "/schemas"
+    for schema_file in [
+        f"{schema_path}/openapi_v2_reference_schema.yaml",
+        f"{schema_path}/openapi_v3_reference_schema.yaml",
+    ]:
+        tester = SchemaTester(schema_file_path=schema_file, preserve_references=True)
+        de_referenced_schema = tester.loader.de_reference_schema(tester.loader.load_schema())
+        for schema_section, response, url_fragment in iterate_schema(de_referenced_schema):
+            if schema_section and response:
+                with patch.object(StaticSchemaLoader, "parameterize_path", side_effect=pass_mock_value(url_fragment)):
+                    tester.validate_response(response)
+
+
+def test_preserved_recursive_references():
+    tester = SchemaTester(schema_file_path="", preserve_references=True)
+    tester.loader.schema = {
+        "openapi": "3.0.0",
+        "paths": {"/comments": {"get": {"responses": {"200": {"$ref": "#/components/responses/Comments"}}}}},
+        "components": {
+            "responses": {
+                "Comments": {
+                    "content": {
+                        "application/json": {
+                            "schema": {"type": "array", "items": {"$ref": "#/components/schemas/Comment"}}
+                        }
+                    }
+                }
+            },
+            "schemas": {
+                "Comment": {
+                    "type": "object",
+                    "properties": {
+                        "text": {"type": "string"},
+                        "replies": {"type": "array", "items": {"$ref": "#/components/schemas/Comment"}},
+                    },
+                }
+            },
+        },
+    }
+    comment = {"text": "deepest", "replies": []}
+    for _ in range(5000):  # deeper than the recursion limit
+        comment = {"text": "reply", "replies": [comment]}
+    response = response_factory({"type": "array", "items": {"type": "string"}}, "/comments", "get")
+    response.json = lambda: [comment]  # type: ignore
+    with patch.object(StaticSchemaLoader, "parameterize_path", side_effect=pass_mock_value("/comments")):
+        tester.validate_response(response)
+
+        comment = {"text": 1, "replies": []}
+        for _ in range(20):
+            comment = {"text": "reply", "replies": [comment]}
+        with pytest.raises(DocumentationError, match="Mismatched types, expected str but received int") as e:
+            tester.validate_response(response)
+        assert e.value.reference == "init.list" + ".dict:key:replies.list" * 20 + ".dict:key:text"
+        assert str(e.value).startswith("Error: Mismatched types")
+
+
+def test_discriminator_mapping():
+    schema = {
+        "openapi": "3.0.0",
+        "info": {"title": "Pets", "version": "1.0.0"},
+        "paths": {
+            "/pets": {
+                "get": {
+                    "responses": {
+                        "200": {
+                            "description": "",
+                            "content": {
+                                "application/json": {
+                                    "schema": {
+                                        "type": "array",
+                                        "items": {
+                                            "oneOf": [
+                                                {"$ref": "#/components/schemas/Dog"},
+                                                {"$ref": "#/components/schemas/Cat"},
+                                            ],
+                                            "discriminator": {
+                                                "propertyName": "petType",
+                                                "mapping": {"dog": "#/components/schemas/Dog", "cat": "Cat"},
+                                            },
+                                        },
+                                    }
+                                }
+                            },
+                        }
+                    }
+                }
+            }
+        },
+        "components": {
+            "schemas": {
+                "Dog": {"type": "object", "properties": {"petType": {"type": "string"}, "bark": {"type": "string"}}},
+                "Cat": {"type": "object", "properties": {"petType": {"type": "string"}, "meow": {"type": "string"}}},
+            }
+        },
+    }
+    for preserve_references in [False, True]:
+        tester = SchemaTester(schema_file_path="", preserve_references=preserve_references)
+        tester.loader.schema = schema if preserve_references else tester.loader.de_reference_schema(deepcopy(schema))
+        response = response_factory({"type": "array", "items": {"type": "string"}}, "/pets", "get")
+        with patch.object(StaticSchemaLoader, "parameterize_path", side_effect=pass_mock_value("/pets")):
+            response.json = lambda: [{"petType": "dog", "bark": "woof"}, {"petType": "cat", "meow": "meow"}]
+            tester.validate_response(response)
+            assert tester.get_compiled_schema_section(response).items.discriminator[1].keys() >= {"dog", "cat"}
+
+            response.json = lambda: [{"petType": "cat", "bark": "woof"}]
+            with pytest.raises(DocumentationError, match="not documented in the OpenAPI schema: bark") as e:
+                tester.validate_response(response)
+            assert e.value.pointer == "/0"
@@ -0,0 +1,83 @@
+import json
+
+import pytest
+
+from openapi_tester import SchemaTester, is_snake_case
+from openapi_tester.stats import ValidationStats
+
+operation = ("/api/{version}/cars/correct", "get", "200")
+
+
+def test_record():
+    stats = ValidationStats()
+    stats.record(operation, "validate", 0.5)
+    stats.record(operation, "validate", 0.25)
+    stats.record(operation, "resolve_path", 0.25)
+    stats.record(operation, "case_check", 0.1)
+    stats.record(None, "load_schema", 2.0)
+    assert stats.get_phases() == {
+        "load_schema": {"count": 1, "seconds": 2.0},
+        "resolve_path": {"count": 1, "seconds": 0.25},
+        "validate": {"count": 2, "seconds": 0.75},
+        "case_check": {"count": 1, "seconds": 0.1},
+    }
+    # case checks are part of validation, so they don't add to the operation's total
+    assert stats.get_operations() == [
+        {
+            "path": "/api/{version}/cars/correct",
+            "method": "get",
+            "status_code": "200",
+            "seconds": 1.0,
+            "phases": {
+                "resolve_path": {"count": 1, "seconds": 0.25},
+                "validate": {"count": 2, "seconds": 0.75},
+                "case_check": {"count": 1, "seconds": 0.1},
+            },
+        }
+    ]
+    stats.clear()
+    assert stats.to_dict() == {"phases": {}, "operations": []}
+
+
+def test_operations_are_sorted_by_time():
+    stats = ValidationStats()
+    stats.record(("/fast", "get", "200"), "validate", 0.1)
+    stats.record(("/slow", "get", "200"), "validate", 0.5)
+    assert [entry["path"] for entry in stats.get_operations()] == ["/slow", "/fast"]
+
+
+def test_validate_response_records_phases(client, tmp_path):
+    tester = SchemaTester(case_tester=is_snake_case)
+    response = client.get("/api/v1/cars/correct")
+    tester.validate_response(response)
+    tester.validate_response(response)
+    phases = tester.stats.get_operations()[0]["phases"]
+    assert set(phases) == {"resolve_path", "lookup_schema", "decode_response", "validate", "case_check"}
+    assert all(phase["count"] == 2 for phase in phases.values())
+    assert tester.stats.get_phases()["load_schema"]["count"] == 1
+
+    report_path = tmp_path / "stats.json"
+    tester.stats.write_json(str(report_path))
+    assert json.loads(report_path.read_text()) == tester.stats.to_dict()
+
+
+def test_failed_validations_are_recorded(client):
+    tester = SchemaTester()
+    with pytest.raises(AssertionError):
+        tester.validate_response(client.get("/api/v1/cars/incorrect"))
+    phases = tester.stats.get_operations()[0]["phases"]
+    assert phases["validate"]["count"] == 1
+    assert phases["format_error"]["count"] == 1
+    assert "case_check" not in phases
+
+
+def test_custom_stats(client):
+    timings = []
+
+    class Recorder(ValidationStats):
+        def record(self, operation, phase, seconds):
+            timings.append((operation, phase))
+
+    tester = SchemaTester(stats=Recorder())
+    tester.validate_response(client.get("/api/v1/cars/correct"))
+    assert (operation, "validate") in timings
@@ -1,6 +1,15 @@
+from unittest.mock import patch
+
 import pytest
 
-from openapi_tester import DocumentationError, OpenAPISchemaError, SchemaTester
+from openapi_tester import (
+    CaseError,
+    DocumentationError,
+    DocumentationErrors,
+    OpenAPISchemaError,
+    SchemaTester,
+    is_camel_case,
+)
 from openapi_tester.constants import OPENAPI_PYTHON_MAPPING
 
 example_schema_array = {"type": "array", "items": {"type": "string"}}
@@ -220,8 +229,134 @@ def test_response_is_missing_keys():
 
 
 def test_schema_object_is_missing_keys():
-    # TODO: Make this pass (not implemented yet)
     """ Excess keys in a response should raise an error """
     with pytest.raises(DocumentationError):
         schema = {"type": "object", "properties": {}}
         tester.test_schema_section(schema, example_object)
+
+
+def test_missing_and_excess_keys_are_reported_together():
+    schema = {"type": "object", "properties": {"a": {"type": "integer"}, "b": {"type": "integer"}}}
+    with pytest.raises(DocumentationError) as e:
+        tester.test_schema_section(schema, {"a": 1, "c": 1, "d": 1})
+    assert e.value.message == (
+        "The following properties are missing from the tested data: b. "
+        "The following properties are not documented in the OpenAPI schema: c, d."
+    )
+
+
+def test_additional_properties():
+    schema = {"type": "object", "additionalProperties": {"type": "integer"}}
+    tester.test_schema_section(schema, {})
+    tester.test_schema_section(schema, {"a": 1, "b": 2})
+    with pytest.raises(DocumentationError, match="expected int but received str") as e:
+        tester.test_schema_section(schema, {"a": 1, "b": "2"}, reference="init")
+    assert e.value.reference == "init.dict:key:b"
+
+    schema = {"type": "object", "properties": {"a": {"type": "string"}}, "additionalProperties": True}
+    tester.test_schema_section(schema, {"a": "1", "b": [2]})
+
+
+def test_free_form_objects():
+    tester.test_schema_section({"type": "object"}, {"a": 1})
+    tester.test_schema_section({"oneOf": [{"type": "object"}, {"type": "string"}]}, {"a": 1})
+    with pytest.raises(DocumentationError, match="not documented in the OpenAPI schema: a"):
+        tester.test_schema_section({"type": "object", "additionalProperties": False}, {"a": 1})
+
+
+def test_collect_errors():
+    schema = {
+        "type": "array",
+        "items": {
+            "type": "object",
+            "properties": {"id": {"type": "integer"}, "tags": {"type": "array", "items": {"type": "string"}}},
+        },
+    }
+    data = [{"id": 1, "tags": ["a"]}, {"id": "2", "tags": ["b", 3]}, {"tags": [], "name": "c"}]
+    with pytest.raises(DocumentationError, match="Mismatched types, expected int but received str") as e:
+        tester.test_schema_section(schema, data)
+    assert e.value.pointer == "/1/id"
+
+    with pytest.raises(DocumentationErrors) as e:
+        tester.test_schema_section(schema, data, reference="init", collect_errors=True)
+    assert e.value.message == "Found 3 documentation errors."
+    assert [(error.pointer, error.reference) for error in e.value.errors] == [
+        ("/1/id", "init.list.dict:key:id"),
+        ("/1/tags/1", "init.list.dict:key:tags.list"),
+        ("/2", "init.list"),
+    ]
+    report = e.value.to_dict()
+    assert report["errors"][1] == {
+        "pointer": "/1/tags/1",
+        "message": "Mismatched types, expected str but received int.",
+        "expected": {"type": "string"},
+        "received": 3,
+        "hint": "",
+    }
+    assert str(e.value).startswith("Found 3 documentation errors.\n\nError: Mismatched types")
+
+    tester.test_schema_section(schema, data[:1], collect_errors=True)
+
+
+def test_collect_errors_includes_case_errors():
+    schema = {"type": "object", "properties": {"id": {"type": "integer"}, "Name": {"type": "string"}}}
+    data = {"id": "1", "Name": "a"}
+    with pytest.raises(CaseError):
+        tester.test_schema_section(schema, data, case_tester=is_camel_case)
+
+    with pytest.raises(DocumentationErrors) as e:
+        tester.test_schema_section(schema, data, case_tester=is_camel_case, collect_errors=True)
+    assert [error.message for error in e.value.errors] == [
+        "The response key `Name` is not properly camelCased. Expected value: name",
+        "Mismatched types, expected int but received str.",
+    ]
+
+
+def test_any_of():
+    schema = {"anyOf": [{"type": "integer"}, {"type": "string"}]}
+    tester.test_schema_section(schema, 1)
+    tester.test_schema_section(schema, "1")
+    with pytest.raises(DocumentationError, match="expected data to match one or more of schema types, received 0"):
+        tester.test_schema_section(schema, [1])
+
+
+def test_discriminator():
+    def pet(pet_type: str, **properties: dict) -> dict:
+        return {"type": "object", "properties": {"petType": {"type": "string", "enum": [pet_type]}, **properties}}
+
+    schema = {
+        "oneOf": [pet("dog", bark={"type": "string"}), pet("cat", meow={"type": "string"})],
+        "discriminator": {"propertyName": "petType"},
+    }
+    tester.test_schema_section(schema, {"petType": "cat", "meow": "meow"})
+    # errors come from the selected option, rather than from counting matches
+    with pytest.raises(DocumentationError, match="not documented in the OpenAPI schema: bark"):
+        tester.test_schema_section(schema, {"petType": "cat", "bark": "woof"})
+    # without a known discriminator value, every option is tried
+    with pytest.raises(DocumentationError, match="received 0 matches"):
+        tester.test_schema_section(schema, {"petType": "cow", "bark": "woof"})
+
+
+def test_one_of_stops_after_two_matches():
+    schema = {
+        "oneOf": [
+            {"type": "array", "items": {"type": "integer"}},
+            {"type": "object", "properties": {"a": {"type": "integer"}}},
+            {"type": "object", "properties": {"a": {"type": "integer"}, "b": {"type": "integer"}}, "required": ["a"]},
+            {"type": "object", "properties": {"a": {"type": "integer"}, "c": {"type": "integer"}}, "required": ["a"]},
+            {"type": "object", "properties": {"a": {"type": "string"}}},
+        ]
+    }
+    tester.test_schema_section(schema, {"a": 1, "b": 2})
+    walked = []
+    walk = tester._walk
+
+    def spy(schema_node, *args, **kwargs):
+        walked.append(schema_node.schema)
+        return walk(schema_node, *args, **kwargs)
+
+    with patch.object(tester, "_walk", side_effect=spy):
+        with pytest.raises(DocumentationError, match="one and only one of schema types, received at least 2 matches"):
+            tester.test_schema_section(schema, {"a": 1})
+    # the array option is skipped by its type, and the last option isn't tried after two matches
+    assert walked[1:] == schema["oneOf"][1:3]
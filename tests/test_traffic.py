@@ -0,0 +1,112 @@
+import base64
+import io
+import json
+
+import pytest
+
+from openapi_tester import SchemaTester, traffic
+from openapi_tester.__main__ import main
+from openapi_tester.traffic import INVALID_RECORD, UNRESOLVED_PATH, iter_har, parse_har_entry, validate_traffic
+
+operation = ("/api/{version}/cars/correct", "get", "200")
+
+
+def har_entry(url, body, mime_type="application/json"):
+    return {
+        "request": {"method": "GET", "url": f"http://localhost{url}"},
+        "response": {"status": 200, "content": {"mimeType": mime_type, "text": json.dumps(body)}},
+    }
+
+
+@pytest.fixture
+def cars(client):
+    return client.get("/api/v1/cars/correct").json(), client.get("/api/v1/cars/incorrect").json()
+
+
+@pytest.fixture
+def capture(tmp_path, cars):
+    entries = [har_entry("/api/v1/cars/correct", cars[i % 2]) for i in range(10)]
+    entries.append(har_entry("/api/v1/cars/correct", "<p></p>", mime_type="text/html"))
+    har_path = tmp_path / "capture.har"
+    har_path.write_text(json.dumps({"log": {"version": "1.2", "pages": [], "entries": entries}}, indent=2))
+    jsonl_path = tmp_path / "dump.jsonl"
+    lines = [
+        {"method": "GET", "path": "/api/v1/cars/correct", "status_code": 200, "body": cars[0]},
+        {"method": "GET", "url": "http://localhost/api/v1/cars/correct", "status": 200, "body": json.dumps(cars[0])},
+        {"method": "GET", "path": "/not-an-endpoint", "status_code": 200, "body": {}},
+    ]
+    jsonl_path.write_text("\n".join(json.dumps(line) for line in lines) + "\nnot json\n")
+    return [str(har_path), str(jsonl_path)]
+
+
+def test_iter_har_reads_entries_across_chunks(monkeypatch, cars):
+    monkeypatch.setattr(traffic, "READ_SIZE", 7)
+    har = json.dumps({"log": {"creator": {"name": "entries"}, "entries": [har_entry("/a", cars[0])] * 3}})
+    assert [record[0] for record in iter_har(io.StringIO(har))] == ["/a"] * 3
+    assert list(iter_har(io.StringIO('{"log": {"entries": []}}'))) == []
+    truncated = list(iter_har(io.StringIO('{"log": {"entries": [{"request": ')))
+    assert len(truncated) == 1 and str(truncated[0]).startswith("Truncated HAR entry")
+
+
+def test_iter_har_finds_the_log_entries(monkeypatch, cars):
+    monkeypatch.setattr(traffic, "READ_SIZE", 7)
+    decoys = {
+        "comment": 'copied from {"entries": [{"request": {}}]}',
+        "creator": {"name": "proxy", "entries": [har_entry("/decoy", cars[0])]},
+        "pages": [{"entries": []}],
+    }
+    har = json.dumps({"note": '"entries": [', "log": {**decoys, "entries": [har_entry("/a", cars[0])]}})
+    assert [record[0] for record in iter_har(io.StringIO(har))] == ["/a"]
+    assert list(iter_har(io.StringIO(json.dumps({"log": decoys})))) == []
+    monkeypatch.setattr(traffic, "READ_SIZE", 7)
+    monkeypatch.setattr(traffic, "MAX_ENTRY_SIZE", 200)
+    entry = json.dumps(har_entry("/a", {"id": 1}))
+    malformed = '{"request": {"url": "}{"}, "response": {"status": 200 "content": {}}}'
+    too_large = json.dumps({**har_entry("/b", {}), "comment": "x" * 150, "cache": {"note": "y" * 150}})
+    har = f'{{"log": {{"entries": [{entry}, {malformed}, {too_large}, {{"request": {{}}}}, {entry}]}}}}'
+    items = list(iter_har(io.StringIO(har)))
+    assert len(items) == 5 and items[0][0] == items[4][0] == "/a"
+    assert [str(item).split(":")[0] for item in items[1:4]] == [
+        "Malformed HAR entry (Expecting ',' delimiter)",
+        "Malformed HAR entry (larger than 200 characters)",
+        "Invalid HAR entry (KeyError('response'))",
+    ]
+
+    results = traffic.validate_items(items, SchemaTester())
+    assert results[INVALID_RECORD][:2] == [3, 3]
+    assert results[INVALID_RECORD][2].startswith("Malformed HAR entry")
+
+
+def test_parse_har_entry():
+    entry = har_entry("/a?page=2", {"id": 1})
+    assert parse_har_entry(entry) == ("/a", "GET", 200, '{"id": 1}')
+    entry["response"]["content"].update(encoding="base64", text=base64.b64encode(b'{"id": 1}').decode())
+    assert parse_har_entry(entry) == ("/a", "GET", 200, '{"id": 1}')
+    assert parse_har_entry(har_entry("/a", "", mime_type="text/plain")) is None
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_validate_traffic(capture, workers):
+    results = validate_traffic(capture, workers=workers, batch_size=3)
+    assert {key: value[:2] for key, value in results.items()} == {
+        operation: [12, 5],
+        (UNRESOLVED_PATH, "get", "200"): [1, 1],
+        INVALID_RECORD: [1, 1],
+    }
+    assert results[operation][2].startswith("GET /api/v1/cars/correct: Error: The following properties are missing")
+
+
+def test_validate_traffic_command(capture, tmp_path, capsys):
+    json_path = tmp_path / "results.json"
+    assert main(["validate-traffic", *capture, "--workers", "1", "--json", str(json_path)]) == 1
+    output = capsys.readouterr().out
+    assert "GET /api/{version}/cars/correct 200" in output
+    assert "14 responses validated, 7 failed" in output
+    result = json.loads(json_path.read_text())[0]
+    assert {key: result[key] for key in ["path", "method", "status_code", "validated", "failed"]} == {
+        "path": "/api/{version}/cars/correct",
+        "method": "get",
+        "status_code": "200",
+        "validated": 12,
+        "failed": 5,
+    }